@@ -9,6 +9,7 @@ import json
 import logging
 import re
 from enum import Enum
+from functools import lru_cache
 from typing import Optional
 
 import boto3
@@ -24,6 +25,52 @@ class QueryComplexity(Enum):
     COMPLEX = "complex"
 
 
+# Compiled once and shared by every router instance
+_COMPILED_COMPLEX: tuple = ()
+_COMPILED_SIMPLE: tuple = ()
+
+
+@lru_cache(maxsize=1024)
+def _classify_heuristic(query: str, context_length: int) -> "QueryComplexity":
+    """Pure heuristic classification, memoized per (query, context_length).
+
+    Conversations repeat queries (retries, button clicks), so the cache
+    turns repeat classifications into a dict lookup.
+    """
+    query_lower = query.lower().strip()
+
+    # Check simple patterns first
+    for pattern in _COMPILED_SIMPLE:
+        if pattern.search(query_lower):
+            return QueryComplexity.SIMPLE
+
+    # Check complex patterns
+    for pattern in _COMPILED_COMPLEX:
+        if pattern.search(query_lower):
+            return QueryComplexity.COMPLEX
+
+    # Heuristics based on query characteristics
+    word_count = len(query.split())
+
+    # Very short queries are typically simple
+    if word_count <= 5:
+        return QueryComplexity.SIMPLE
+
+    # Long queries or those with lots of context are complex
+    if word_count > 50 or context_length > 10:
+        return QueryComplexity.COMPLEX
+
+    # Questions with specific keywords
+    if any(
+        word in query_lower
+        for word in ["why", "how", "explain", "analyze", "troubleshoot"]
+    ):
+        return QueryComplexity.COMPLEX
+
+    # Default to simple for efficiency
+    return QueryComplexity.SIMPLE
+
+
 class ModelRouter:
     """
     Routes queries to appropriate LLMs based on complexity.
@@ -91,13 +138,9 @@ class ModelRouter:
 
         self.bedrock_runtime = boto3.client("bedrock-runtime", region_name=region)
 
-        # Compile patterns
-        self._complex_patterns = [
-            re.compile(p, re.IGNORECASE) for p in self.COMPLEX_PATTERNS
-        ]
-        self._simple_patterns = [
-            re.compile(p, re.IGNORECASE) for p in self.SIMPLE_PATTERNS
-        ]
+        # Patterns are compiled once at module level and shared
+        self._complex_patterns = _COMPILED_COMPLEX
+        self._simple_patterns = _COMPILED_SIMPLE
 
         # Usage statistics
         self.routing_stats = {"claude": 0, "titan": 0}
@@ -113,38 +156,7 @@ class ModelRouter:
         Returns:
             QueryComplexity (SIMPLE or COMPLEX)
         """
-        query_lower = query.lower().strip()
-
-        # Check simple patterns first
-        for pattern in self._simple_patterns:
-            if pattern.search(query_lower):
-                return QueryComplexity.SIMPLE
-
-        # Check complex patterns
-        for pattern in self._complex_patterns:
-            if pattern.search(query_lower):
-                return QueryComplexity.COMPLEX
-
-        # Heuristics based on query characteristics
-        word_count = len(query.split())
-
-        # Very short queries are typically simple
-        if word_count <= 5:
-            return QueryComplexity.SIMPLE
-
-        # Long queries or those with lots of context are complex
-        if word_count > 50 or context_length > 10:
-            return QueryComplexity.COMPLEX
-
-        # Questions with specific keywords
-        if any(
-            word in query_lower
-            for word in ["why", "how", "explain", "analyze", "troubleshoot"]
-        ):
-            return QueryComplexity.COMPLEX
-
-        # Default to simple for efficiency
-        return QueryComplexity.SIMPLE
+        return _classify_heuristic(query, context_length)
 
     def classify_with_llm(self, query: str) -> QueryComplexity:
         """
@@ -253,3 +265,11 @@ Respond with only one word: SIMPLE or COMPLEX"""
     def reset_stats(self) -> None:
         """Reset routing statistics."""
         self.routing_stats = {"claude": 0, "titan": 0}
+
+
+_COMPILED_COMPLEX = tuple(
+    re.compile(p, re.IGNORECASE) for p in ModelRouter.COMPLEX_PATTERNS
+)
+_COMPILED_SIMPLE = tuple(
+    re.compile(p, re.IGNORECASE) for p in ModelRouter.SIMPLE_PATTERNS
+)
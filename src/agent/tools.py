@@ -280,7 +280,7 @@ class KnowledgeBaseTools:
 
 
 # Tool schemas for agent integration
-TOOL_SCHEMAS = [
+TOOL_SCHEMAS = (
     {
         "name": "create_ticket",
         "description": "Create a new support ticket in the system",
@@ -401,4 +401,7 @@ TOOL_SCHEMAS = [
             "required": ["query"],
         },
     },
-]
+)
+
+# Name-keyed view for O(1) schema lookups
+TOOL_SCHEMAS_BY_NAME = {schema["name"]: schema for schema in TOOL_SCHEMAS}
@@ -9,6 +9,7 @@ import json
 import logging
 import os
 import uuid
+from collections import Counter
 from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Any
@@ -282,6 +283,52 @@ def list_tickets(event: dict) -> dict:
         return create_response(500, {"error": "Failed to list tickets"})
 
 
+def get_ticket_summary(event: dict) -> dict:
+    """Return pre-aggregated ticket statistics.
+
+    Scans only the three grouping attributes and returns a few hundred
+    bytes of counts, so clients no longer download full ticket payloads
+    just to build histograms.
+    """
+    try:
+        scan_kwargs = {
+            "ProjectionExpression": "#status, Priority, Category",
+            "ExpressionAttributeNames": {"#status": "Status"},
+        }
+
+        total = 0
+        by_status = Counter()
+        by_priority = Counter()
+        by_category = Counter()
+
+        while True:
+            response = tickets_table.scan(**scan_kwargs)
+            items = response.get("Items", [])
+            total += len(items)
+            by_status.update(item.get("Status", "Unknown") for item in items)
+            by_priority.update(item.get("Priority", "Unknown") for item in items)
+            by_category.update(item.get("Category", "Unknown") for item in items)
+
+            if "LastEvaluatedKey" not in response:
+                break
+            scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+        return create_response(
+            200,
+            {
+                "summary": {
+                    "total_tickets": total,
+                    "by_status": dict(by_status),
+                    "by_priority": dict(by_priority),
+                    "by_category": dict(by_category),
+                }
+            },
+        )
+    except ClientError as e:
+        logger.error(f"Failed to summarize tickets: {e}")
+        return create_response(500, {"error": "Failed to summarize tickets"})
+
+
 def health_check(event: dict) -> dict:
     """Health check endpoint."""
     return create_response(
@@ -309,6 +356,8 @@ def lambda_handler(event: dict, context: Any) -> dict:
         return create_ticket(event)
     elif path == "/tickets" and http_method == "GET":
         return list_tickets(event)
+    elif path == "/tickets/summary" and http_method == "GET":
+        return get_ticket_summary(event)
     elif path.startswith("/tickets/") and http_method == "GET":
         return get_ticket(event)
     elif path.startswith("/tickets/") and http_method in ["PATCH", "PUT"]:
@@ -7,6 +7,8 @@ for the OpenSearch vector index.
 """
 
 import argparse
+import hashlib
+import io
 import json
 import logging
 import os
@@ -15,8 +17,16 @@ from datetime import datetime, timezone
 from typing import Optional
 
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+# Optional fast JSON decoder for the ~30 KB embedding response bodies
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -28,6 +38,10 @@ logger = logging.getLogger(__name__)
 class DataIngester:
     """Handles data ingestion for the MSP Support Assistant."""
 
+    # Manifest tracking content hashes of the last successful ingestion,
+    # used to skip steps when the source files have not changed.
+    MANIFEST_KEY = "knowledge-base/manifest.json"
+
     def __init__(
         self,
         region: str = "us-east-1",
@@ -58,29 +72,114 @@ class DataIngester:
         )
         self.embedding_model = embedding_model
 
-        # Initialize AWS clients
-        self.dynamodb = boto3.resource("dynamodb", region_name=region)
-        self.bedrock_runtime = boto3.client("bedrock-runtime", region_name=region)
-        self.s3 = boto3.client("s3", region_name=region)
+        # Initialize AWS clients with a shared connection pool so repeated
+        # calls (thousands of embedding requests) reuse warm TLS sockets
+        # instead of re-handshaking per call.
+        client_config = Config(
+            max_pool_connections=64,
+            tcp_keepalive=True,
+            retries={"mode": "adaptive", "max_attempts": 8},
+            connect_timeout=3,
+            read_timeout=30,
+        )
+        self.dynamodb = boto3.resource("dynamodb", region_name=region, config=client_config)
+        self.bedrock_runtime = boto3.client(
+            "bedrock-runtime", region_name=region, config=client_config
+        )
+        self.s3 = boto3.client("s3", region_name=region, config=client_config)
 
         # OpenSearch client (using requests with SigV4)
         self._opensearch_session = None
 
+        # Precomputed request-body template for invoke_model: only the text
+        # varies per call, so avoid rebuilding the payload dict every time.
+        self._embed_body_tmpl = b'{"inputText":%s}'
+
+    def file_sha256(self, file_path: str) -> str:
+        """Compute the SHA-256 hex digest of a file's raw bytes."""
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(65536), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def load_manifest(self) -> dict:
+        """Load the ingestion manifest from S3 (empty if missing)."""
+        if not self.vector_bucket:
+            return {}
+        try:
+            response = self.s3.get_object(
+                Bucket=self.vector_bucket, Key=self.MANIFEST_KEY
+            )
+            return json.loads(response["Body"].read())
+        except (ClientError, json.JSONDecodeError):
+            return {}
+
+    def save_manifest(self, manifest: dict) -> None:
+        """Persist the ingestion manifest to S3."""
+        if not self.vector_bucket or not manifest:
+            return
+        try:
+            self.s3.put_object(
+                Bucket=self.vector_bucket,
+                Key=self.MANIFEST_KEY,
+                Body=json.dumps(manifest),
+                ContentType="application/json",
+            )
+            logger.info(f"Saved manifest to s3://{self.vector_bucket}/{self.MANIFEST_KEY}")
+        except ClientError as e:
+            logger.error(f"Failed to save manifest: {e}")
+
+    def ticket_hash(self, ticket: dict) -> str:
+        """Compute a stable content hash for a ticket record."""
+        canonical = json.dumps(ticket, sort_keys=True, separators=(",", ":"))
+        return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _fetch_existing_hashes(self, ticket_ids: list) -> dict:
+        """Fetch ContentHash attributes for existing tickets via BatchGetItem.
+
+        Returns a mapping of TicketId -> ContentHash for tickets already
+        in the table (missing or hashless tickets are omitted).
+        """
+        existing = {}
+        try:
+            # BatchGetItem accepts at most 100 keys per request
+            for i in range(0, len(ticket_ids), 100):
+                batch = ticket_ids[i:i + 100]
+                response = self.dynamodb.batch_get_item(
+                    RequestItems={
+                        self.tickets_table: {
+                            "Keys": [{"TicketId": tid} for tid in batch],
+                            "ProjectionExpression": "TicketId, ContentHash",
+                        }
+                    }
+                )
+                for item in response.get("Responses", {}).get(self.tickets_table, []):
+                    if "ContentHash" in item:
+                        existing[item["TicketId"]] = item["ContentHash"]
+        except ClientError as e:
+            logger.warning(f"Failed to fetch existing ticket hashes: {e}")
+        return existing
+
     def get_embedding(self, text: str) -> list:
         """Generate embedding using Bedrock."""
         try:
-            body = json.dumps({"inputText": text})
+            body = self._embed_body_tmpl % json.dumps(text).encode("utf-8")
             response = self.bedrock_runtime.invoke_model(
                 modelId=self.embedding_model,
                 body=body,
             )
-            response_body = json.loads(response["body"].read())
-            return response_body.get("embedding", [])
+            # Decode the body in one pass; orjson parses the large float
+            # vector in C when available, stdlib json otherwise.
+            raw = response["body"].read()
+            if orjson is not None:
+                return orjson.loads(raw).get("embedding", [])
+            return json.loads(raw).get("embedding", [])
         except ClientError as e:
             logger.error(f"Failed to generate embedding: {e}")
             return []
 
-    def load_sample_tickets(self, file_path: str) -> int:
+    def load_sample_tickets(self, file_path: str) -> bool:
         """
         Load sample tickets into DynamoDB.
 
@@ -88,7 +187,7 @@ class DataIngester:
             file_path: Path to sample_tickets.json
 
         Returns:
-            Number of tickets loaded
+            True when every changed ticket was written successfully
         """
         logger.info(f"Loading tickets from {file_path}")
 
@@ -97,14 +196,27 @@ class DataIngester:
                 tickets = json.load(f)
         except Exception as e:
             logger.error(f"Failed to read file: {e}")
-            return 0
+            return False
 
         table = self.dynamodb.Table(self.tickets_table)
         count = 0
+        skipped = 0
+        failed = 0
         timestamp = datetime.now(timezone.utc).isoformat()
 
+        # Skip tickets whose content is unchanged since the last run;
+        # every put_item is a paid write even when the data is identical.
+        existing_hashes = self._fetch_existing_hashes(
+            [t["id"] for t in tickets if "id" in t]
+        )
+
         for ticket in tickets:
             try:
+                content_hash = self.ticket_hash(ticket)
+                if existing_hashes.get(ticket["id"]) == content_hash:
+                    skipped += 1
+                    continue
+
                 item = {
                     "TicketId": ticket["id"],
                     "Title": ticket["title"],
@@ -116,6 +228,7 @@ class DataIngester:
                     "CreatedAt": timestamp,
                     "UpdatedAt": timestamp,
                     "CustomerId": "sample-customer",
+                    "ContentHash": content_hash,
                 }
 
                 if ticket.get("resolution"):
@@ -128,15 +241,18 @@ class DataIngester:
 
                 table.put_item(Item=item)
                 count += 1
-                logger.info(f"Loaded ticket: {ticket['id']}")
+                logger.info("Loaded ticket: %s", ticket["id"])
 
             except ClientError as e:
-                logger.error(f"Failed to load ticket {ticket['id']}: {e}")
+                failed += 1
+                logger.error("Failed to load ticket %s: %s", ticket["id"], e)
 
+        if skipped:
+            logger.info(f"Skipped {skipped} unchanged tickets")
         logger.info(f"Successfully loaded {count} tickets")
-        return count
+        return failed == 0
 
-    def create_knowledge_embeddings(self, file_path: str) -> int:
+    def create_knowledge_embeddings(self, file_path: str) -> bool:
         """
         Create embeddings for knowledge base articles.
 
@@ -144,7 +260,7 @@ class DataIngester:
             file_path: Path to knowledge_base.json
 
         Returns:
-            Number of embeddings created
+            True when embeddings were created and persisted successfully
         """
         logger.info(f"Creating embeddings from {file_path}")
 
@@ -153,7 +269,7 @@ class DataIngester:
                 articles = json.load(f)
         except Exception as e:
             logger.error(f"Failed to read file: {e}")
-            return 0
+            return False
 
         count = 0
         embeddings_data = []
@@ -174,29 +290,37 @@ class DataIngester:
                 }
                 embeddings_data.append(embedding_record)
                 count += 1
-                logger.info(f"Created embedding for: {article['id']}")
+                logger.info("Created embedding for: %s", article["id"])
             else:
-                logger.warning(f"Failed to create embedding for: {article['id']}")
+                logger.warning("Failed to create embedding for: %s", article["id"])
 
-        # Save embeddings to S3 (for S3 Vector Store)
+        # Save embeddings to S3 (for S3 Vector Store). Large payloads go up
+        # as concurrent multipart uploads instead of a single-shot PUT.
         if self.vector_bucket and embeddings_data:
             try:
-                self.s3.put_object(
+                buf = io.BytesIO(json.dumps(embeddings_data).encode("utf-8"))
+                self.s3.upload_fileobj(
+                    buf,
                     Bucket=self.vector_bucket,
                     Key="knowledge-base/embeddings.json",
-                    Body=json.dumps(embeddings_data),
-                    ContentType="application/json",
+                    ExtraArgs={"ContentType": "application/json"},
+                    Config=TransferConfig(
+                        multipart_threshold=8 * 1024 * 1024,
+                        multipart_chunksize=8 * 1024 * 1024,
+                        max_concurrency=8,
+                    ),
                 )
                 logger.info(f"Saved embeddings to s3://{self.vector_bucket}/knowledge-base/embeddings.json")
             except ClientError as e:
                 logger.error(f"Failed to save embeddings to S3: {e}")
+                return False
 
         # Index in OpenSearch (if endpoint configured)
         if self.opensearch_endpoint and embeddings_data:
             self._index_to_opensearch(embeddings_data)
 
         logger.info(f"Successfully created {count} embeddings")
-        return count
+        return count == len(articles)
 
     def _index_to_opensearch(self, embeddings_data: list) -> None:
         """
@@ -330,6 +454,11 @@ def main():
         action="store_true",
         help="Skip creating knowledge base embeddings",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-ingest even if source files are unchanged since the last run",
+    )
 
     args = parser.parse_args()
 
@@ -346,12 +475,35 @@ def main():
             print(f"  {service}: {status_text}")
         sys.exit(0 if all(results.values()) else 1)
 
-    # Load data
+    # Load data, skipping steps whose source files are unchanged since
+    # the last successful run (tracked via a content-hash manifest in S3)
+    manifest = {} if args.force else ingester.load_manifest()
+
     if not args.skip_tickets:
-        ingester.load_sample_tickets(args.tickets_file)
+        try:
+            tickets_sha = ingester.file_sha256(args.tickets_file)
+        except OSError:
+            # Unreadable source file: run the step anyway so its own
+            # error handling logs the failure and the script continues
+            tickets_sha = None
+        if tickets_sha is not None and manifest.get("tickets_sha") == tickets_sha:
+            logger.info("Tickets file unchanged, skipping (use --force to re-ingest)")
+        elif ingester.load_sample_tickets(args.tickets_file) and tickets_sha is not None:
+            # Record the hash only when the step succeeded, so a failed
+            # run is retried next time instead of silently skipped
+            manifest["tickets_sha"] = tickets_sha
 
     if not args.skip_embeddings:
-        ingester.create_knowledge_embeddings(args.knowledge_file)
+        try:
+            kb_sha = ingester.file_sha256(args.knowledge_file)
+        except OSError:
+            kb_sha = None
+        if kb_sha is not None and manifest.get("kb_sha") == kb_sha:
+            logger.info("Knowledge base unchanged, skipping (use --force to re-ingest)")
+        elif ingester.create_knowledge_embeddings(args.knowledge_file) and kb_sha is not None:
+            manifest["kb_sha"] = kb_sha
+
+    ingester.save_manifest(manifest)
 
     print("\nData ingestion complete!")
 
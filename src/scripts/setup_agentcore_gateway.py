@@ -20,6 +20,7 @@ import json
 import logging
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import boto3
 from botocore.exceptions import ClientError
@@ -40,6 +41,7 @@ class AgentCoreGatewaySetup:
         self.environment = environment
         self.project_name = project_name
         self.name_prefix = f"{project_name}-{environment}"
+        self._param_prefix = f"/{project_name}/{environment}"
 
         # Initialize clients
         self.ssm = boto3.client("ssm", region_name=region)
@@ -61,14 +63,14 @@ class AgentCoreGatewaySetup:
         try:
             # Get Lambda ARN
             response = self.ssm.get_parameter(
-                Name=f"/{self.project_name}/{self.environment}/agentcore-tools-lambda-arn"
+                Name=f"{self._param_prefix}/agentcore-tools-lambda-arn"
             )
             self.lambda_arn = response["Parameter"]["Value"]
             logger.info(f"Lambda ARN: {self.lambda_arn}")
 
             # Get Gateway Role ARN
             response = self.ssm.get_parameter(
-                Name=f"/{self.project_name}/{self.environment}/agentcore-gateway-role-arn"
+                Name=f"{self._param_prefix}/agentcore-gateway-role-arn"
             )
             self.gateway_role_arn = response["Parameter"]["Value"]
             logger.info(f"Gateway Role ARN: {self.gateway_role_arn}")
@@ -338,21 +340,22 @@ class AgentCoreGatewaySetup:
                     targetConfiguration=target_config,
                     credentialProviderConfigurations=credential_config
                 )
-                logger.info(f"Added target: {tool['name']}")
+                logger.info("Added target: %s", tool["name"])
 
             except ClientError as e:
-                logger.error(f"Failed to add target {tool['name']}: {e}")
+                logger.error("Failed to add target %s: %s", tool["name"], e)
 
     def _save_gateway_config(self, gateway_id: str, mcp_endpoint: str, cognito_config: dict):
         """Save gateway configuration to SSM."""
         params = {
-            f"/{self.project_name}/{self.environment}/agentcore-gateway-id": gateway_id,
-            f"/{self.project_name}/{self.environment}/agentcore-mcp-endpoint": mcp_endpoint,
-            f"/{self.project_name}/{self.environment}/cognito-client-id": cognito_config["client_id"],
-            f"/{self.project_name}/{self.environment}/cognito-discovery-url": cognito_config["discovery_url"],
+            f"{self._param_prefix}/agentcore-gateway-id": gateway_id,
+            f"{self._param_prefix}/agentcore-mcp-endpoint": mcp_endpoint,
+            f"{self._param_prefix}/cognito-client-id": cognito_config["client_id"],
+            f"{self._param_prefix}/cognito-discovery-url": cognito_config["discovery_url"],
         }
 
-        for name, value in params.items():
+        def put_param(item):
+            name, value = item
             try:
                 self.ssm.put_parameter(
                     Name=name,
@@ -360,9 +363,14 @@ class AgentCoreGatewaySetup:
                     Type="String",
                     Overwrite=True
                 )
-                logger.info(f"Saved SSM parameter: {name}")
+                logger.info("Saved SSM parameter: %s", name)
             except ClientError as e:
-                logger.error(f"Failed to save parameter {name}: {e}")
+                logger.error("Failed to save parameter %s: %s", name, e)
+
+        # SSM has no bulk put; parallel single-puts finish in roughly one
+        # API round-trip instead of four.
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(put_param, params.items()))
 
     def _create_gateway_config_file(self):
         """Create a configuration file for manual gateway setup."""
@@ -0,0 +1,93 @@
+"""
+MSP Support Assistant - Shared Ticket API client
+
+Connection-pooled HTTP access to the Ticket API Gateway, shared by the
+Streamlit front-ends (app.py, app_basic.py) so each app no longer carries
+its own copy of the session factory and request plumbing.
+"""
+
+import os
+import time
+from typing import Optional
+
+import streamlit as st
+
+# API Gateway endpoint (fallback for direct API access)
+API_GATEWAY_ENDPOINT = os.environ.get(
+    "API_GATEWAY_ENDPOINT",
+    "https://p3h9ge8d92.execute-api.us-east-1.amazonaws.com",
+)
+# Normalized once at import rather than per call
+API_BASE = API_GATEWAY_ENDPOINT.rstrip("/")
+
+
+@st.cache_resource
+def get_http_session():
+    """Shared connection-pooled HTTP session for API Gateway and Cognito.
+
+    One session per server process keeps TLS connections warm across
+    reruns and sessions instead of handshaking on every request.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=50,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Circuit breaker: after _BREAKER_THRESHOLD consecutive transport
+# failures, fail fast for _BREAKER_COOLDOWN seconds instead of letting
+# every click block until the timeout while the API is down
+_BREAKER_THRESHOLD = 5
+_BREAKER_COOLDOWN = 30.0
+_breaker = {"fails": 0, "opened_at": 0.0}
+
+
+def request_json(
+    method: str,
+    endpoint: str,
+    data: Optional[dict] = None,
+    headers: Optional[dict] = None,
+    timeout: tuple = (3, 10),
+) -> dict:
+    """Perform one JSON request against the Ticket API.
+
+    Returns the decoded response body, or {"error": ...} on transport
+    failure or while the circuit breaker is open.
+    """
+    import requests
+
+    if _breaker["fails"] >= _BREAKER_THRESHOLD:
+        if time.time() - _breaker["opened_at"] < _BREAKER_COOLDOWN:
+            return {"error": "Ticket API temporarily unavailable (circuit open)"}
+
+    request_headers = {"Content-Type": "application/json"}
+    if headers:
+        request_headers.update(headers)
+
+    try:
+        response = get_http_session().request(
+            method,
+            f"{API_BASE}{endpoint}",
+            headers=request_headers,
+            json=data,
+            timeout=timeout,
+        )
+        _breaker["fails"] = 0
+        return response.json()
+    except requests.exceptions.RequestException as e:
+        _breaker["fails"] += 1
+        _breaker["opened_at"] = time.time()
+        return {"error": str(e)}
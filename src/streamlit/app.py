@@ -16,15 +16,40 @@ Usage:
 
 import json
 import os
+import re
 import time
 import uuid
+from collections import Counter, deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional
+from urllib.parse import urlencode
 
-import boto3
-import requests
 import streamlit as st
-from botocore.exceptions import ClientError
+
+# boto3 itself is imported lazily in _get_client (its import costs hundreds
+# of ms and is never needed on the credential-less public API path)
+try:
+    from botocore.exceptions import ClientError
+except ImportError:
+    class ClientError(Exception):
+        """Placeholder so except clauses work when boto3 is not installed."""
+
+# orjson is optional: JSON hot paths fall back to the stdlib when the
+# faster library isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Ticket API plumbing shared with the basic app (the pooled session also
+# serves the Cognito token endpoint)
+from api_client import (
+    API_BASE as _API_BASE,
+    API_GATEWAY_ENDPOINT,
+    get_http_session as _http_session,
+)
 
 # Page configuration
 st.set_page_config(
@@ -62,11 +87,6 @@ COGNITO_CLIENT_ID = os.environ.get("COGNITO_CLIENT_ID", "")
 COGNITO_CLIENT_SECRET = os.environ.get("COGNITO_CLIENT_SECRET", "")
 COGNITO_TOKEN_ENDPOINT = os.environ.get("COGNITO_TOKEN_ENDPOINT", "")
 
-# API Gateway endpoint (fallback for direct API access)
-API_GATEWAY_ENDPOINT = os.environ.get(
-    "API_GATEWAY_ENDPOINT",
-    "https://p3h9ge8d92.execute-api.us-east-1.amazonaws.com"
-)
 
 # AgentCore Memory configuration
 AGENTCORE_MEMORY_ID = os.environ.get(
@@ -76,10 +96,48 @@ AGENTCORE_MEMORY_ID = os.environ.get(
 # Default actor ID for demo (in production, this would be the authenticated user ID)
 DEFAULT_ACTOR_ID = os.environ.get("DEFAULT_ACTOR_ID", "demo-user")
 
+# Chat history ring buffer: cap retained messages and only render the
+# most recent page so per-rerun work stays O(1) in session length
+_HISTORY_MAXLEN = 100
+_HISTORY_PAGE = 20
+
+# Thinking tags Nova sometimes emits, stripped from final responses
+_THINKING_RE = re.compile(r"<thinking>.*?</thinking>\s*", re.DOTALL)
+
+
+@st.cache_resource
+def _get_client(service: str, region: str):
+    """Create (or return the cached) boto3 client for a service/region.
+
+    Client construction is expensive (service model load, endpoint
+    resolution), so one client per service is shared across all sessions.
+    """
+    import boto3
+
+    return boto3.Session().client(service, region_name=region)
+
+
+@st.cache_resource(ttl=3600)
+def _aws_credentials_available(region: str) -> bool:
+    """Probe AWS credentials once per hour instead of per session."""
+    try:
+        _get_client("sts", region).get_caller_identity()
+        return True
+    except Exception:
+        return False
+
 
-def load_config_from_ssm():
+@st.cache_resource(ttl=900)
+def load_config_from_ssm(
+    project_name: str = PROJECT_NAME,
+    environment: str = ENVIRONMENT,
+    region: str = AWS_REGION,
+):
     """Load AgentCore Gateway configuration from SSM Parameter Store.
 
+    The result is cached for 15 minutes and shared by all sessions on this
+    server, so only the first cold session pays the SSM round-trip.
+
     Returns empty config if AWS credentials are not available (e.g., Streamlit Cloud).
     """
     # Skip SSM if we detect we're on Streamlit Cloud without credentials
@@ -91,25 +149,21 @@ def load_config_from_ssm():
         }
 
     try:
-        ssm = boto3.client("ssm", region_name=AWS_REGION)
-
-        config = {}
-        params = [
-            ("agentcore-mcp-endpoint", "mcp_endpoint"),
-            ("cognito-client-id", "cognito_client_id"),
-            ("cognito-discovery-url", "cognito_discovery_url"),
-        ]
-
-        for param_name, config_key in params:
-            try:
-                response = ssm.get_parameter(
-                    Name=f"/{PROJECT_NAME}/{ENVIRONMENT}/{param_name}"
-                )
-                config[config_key] = response["Parameter"]["Value"]
-            except ClientError:
-                pass
+        ssm = _get_client("ssm", region)
+
+        # One batched get_parameters call instead of three get_parameter
+        # round-trips (SSM throttles aggressively under load)
+        params = {
+            f"/{project_name}/{environment}/agentcore-mcp-endpoint": "mcp_endpoint",
+            f"/{project_name}/{environment}/cognito-client-id": "cognito_client_id",
+            f"/{project_name}/{environment}/cognito-discovery-url": "cognito_discovery_url",
+        }
+        response = ssm.get_parameters(Names=list(params), WithDecryption=True)
 
-        return config
+        return {
+            params[p["Name"]]: p["Value"]
+            for p in response.get("Parameters", [])
+        }
     except Exception:
         # No AWS credentials available - this is fine for Streamlit Cloud
         # The app will work with direct API calls
@@ -117,32 +171,20 @@ def load_config_from_ssm():
 
 
 def get_bedrock_client():
-    """Get or create Bedrock runtime client (lazy initialization)."""
-    if "bedrock_client" not in st.session_state:
-        st.session_state.bedrock_client = None
-        try:
-            client = boto3.client("bedrock-runtime", region_name=AWS_REGION)
-            # Test if credentials are available by checking caller identity
-            sts = boto3.client("sts", region_name=AWS_REGION)
-            sts.get_caller_identity()
-            st.session_state.bedrock_client = client
-        except Exception:
-            # No AWS credentials - Bedrock won't work, but API calls will
-            st.session_state.bedrock_client = None
-    return st.session_state.bedrock_client
+    """Get the shared Bedrock runtime client (None without credentials)."""
+    if not _aws_credentials_available(AWS_REGION):
+        # No AWS credentials - Bedrock won't work, but API calls will
+        return None
+    return _get_client("bedrock-runtime", AWS_REGION)
 
 
 def get_agentcore_runtime_client():
-    """Get or create AgentCore Runtime client for memory operations."""
-    if "agentcore_runtime_client" not in st.session_state:
-        st.session_state.agentcore_runtime_client = None
-        try:
-            # AgentCore Data Plane API - service name is "bedrock-agentcore"
-            client = boto3.client("bedrock-agentcore", region_name=AWS_REGION)
-            st.session_state.agentcore_runtime_client = client
-        except Exception:
-            st.session_state.agentcore_runtime_client = None
-    return st.session_state.agentcore_runtime_client
+    """Get the shared AgentCore Runtime client for memory operations."""
+    try:
+        # AgentCore Data Plane API - service name is "bedrock-agentcore"
+        return _get_client("bedrock-agentcore", AWS_REGION)
+    except Exception:
+        return None
 
 
 def store_conversation_event(user_message: str, assistant_response: str, actor_id: str = None, session_id: str = None):
@@ -302,7 +344,7 @@ def format_memory_context(records: list) -> str:
 def init_session_state():
     """Initialize Streamlit session state."""
     if "messages" not in st.session_state:
-        st.session_state.messages = []
+        st.session_state.messages = deque(maxlen=_HISTORY_MAXLEN)
     if "session_id" not in st.session_state:
         st.session_state.session_id = f"session-{int(time.time())}"
     if "config" not in st.session_state:
@@ -317,39 +359,67 @@ def init_session_state():
         st.session_state.memory_errors = []
     if "memory_records" not in st.session_state:
         st.session_state.memory_records = []
+    if "bedrock_available" not in st.session_state:
+        # Checked once per session; the sidebar badge reads this flag so a
+        # button click doesn't re-probe credentials on every rerun
+        st.session_state.bedrock_available = get_bedrock_client() is not None
+
+
+@st.cache_resource
+def _cognito_token_cache() -> dict:
+    """Server-wide Cognito token cache ({"token", "exp", "lock"}).
+
+    Lives behind st.cache_resource so it survives script reruns and is
+    shared by all sessions.
+    """
+    import threading
+
+    return {"token": None, "exp": 0.0, "lock": threading.Lock()}
 
 
 def get_cognito_token() -> Optional[str]:
-    """Get access token from Cognito using client credentials flow."""
+    """Get access token from Cognito using client credentials flow.
+
+    Tokens are cached until shortly before expiry so only one OAuth
+    round-trip is made per token lifetime (typically an hour) instead of
+    one per API call.
+    """
     if not COGNITO_TOKEN_ENDPOINT or not COGNITO_CLIENT_ID or not COGNITO_CLIENT_SECRET:
         return None
 
-    try:
-        response = requests.post(
-            COGNITO_TOKEN_ENDPOINT,
-            data={
-                "grant_type": "client_credentials",
-                "client_id": COGNITO_CLIENT_ID,
-                "client_secret": COGNITO_CLIENT_SECRET,
-                "scope": "agentcore-gateway/tools agentcore-gateway/invoke"
-            },
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-            timeout=10
-        )
-        response.raise_for_status()
-        return response.json().get("access_token")
-    except Exception as e:
-        st.warning(f"Failed to get Cognito token: {e}")
-        return None
+    cache = _cognito_token_cache()
+    # Refresh 60 s early so in-flight requests never carry a stale token
+    if cache["token"] and time.time() < cache["exp"] - 60:
+        return cache["token"]
 
+    with cache["lock"]:
+        # Another session may have refreshed while we waited for the lock
+        if cache["token"] and time.time() < cache["exp"] - 60:
+            return cache["token"]
 
-def get_system_prompt(memory_context: str = "") -> str:
-    """Get the system prompt for the agent.
+        try:
+            response = _http_session().post(
+                COGNITO_TOKEN_ENDPOINT,
+                data={
+                    "grant_type": "client_credentials",
+                    "client_id": COGNITO_CLIENT_ID,
+                    "client_secret": COGNITO_CLIENT_SECRET,
+                    "scope": "agentcore-gateway/tools agentcore-gateway/invoke"
+                },
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+                timeout=10
+            )
+            response.raise_for_status()
+            payload = response.json()
+            cache["token"] = payload.get("access_token")
+            cache["exp"] = time.time() + payload.get("expires_in", 3600)
+            return cache["token"]
+        except Exception as e:
+            st.warning(f"Failed to get Cognito token: {e}")
+            return None
 
-    Args:
-        memory_context: Optional context from AgentCore Memory (long-term memory)
-    """
-    base_prompt = """You are an intelligent MSP (Managed Service Provider) Support Assistant with access to a ticket management system.
+
+_SYSTEM_PROMPT = """You are an intelligent MSP (Managed Service Provider) Support Assistant with access to a ticket management system.
 
 You have access to the following tools:
 1. **list_tickets**: List all tickets or filter by status (Open, In Progress, Resolved, Closed)
@@ -376,26 +446,41 @@ If you can't access the tools, explain what you would do and suggest the user ch
 
 IMPORTANT: You have memory capabilities. If users tell you their name, preferences, or other personal information, acknowledge and remember it. Use any memory context provided below to personalize your responses."""
 
+# Pre-built system block for the common no-memory-context case, so converse
+# calls don't re-allocate the list/dict wrapper every turn
+_SYSTEM_PROMPT_BLOCK = [{"text": _SYSTEM_PROMPT}]
+
+
+def get_system_prompt(memory_context: str = "") -> str:
+    """Get the system prompt for the agent.
+
+    Args:
+        memory_context: Optional context from AgentCore Memory (long-term memory)
+    """
     if memory_context:
-        return base_prompt + memory_context
-    return base_prompt
+        return _SYSTEM_PROMPT + memory_context
+    return _SYSTEM_PROMPT
 
 
 def call_ticket_api(endpoint: str, method: str = "GET", data: Optional[dict] = None) -> dict:
     """Call the Ticket API directly (fallback when AgentCore not available)."""
-    url = f"{API_GATEWAY_ENDPOINT.rstrip('/')}{endpoint}"
+    import requests
+
+    if method not in ("GET", "POST", "PATCH"):
+        return {"error": f"Unsupported method: {method}"}
+
+    url = f"{_API_BASE}{endpoint}"
     headers = {"Content-Type": "application/json"}
 
     try:
-        if method == "GET":
-            response = requests.get(url, headers=headers, timeout=30)
-        elif method == "POST":
-            response = requests.post(url, headers=headers, json=data, timeout=30)
-        elif method == "PATCH":
-            response = requests.patch(url, headers=headers, json=data, timeout=30)
-        else:
-            return {"error": f"Unsupported method: {method}"}
-
+        # Pre-serialize the body with orjson when available; requests'
+        # json= kwarg goes through the slower stdlib encoder
+        body = orjson.dumps(data) if (data is not None and orjson is not None) else None
+        response = _http_session().request(
+            method, url, headers=headers,
+            data=body, json=data if body is None else None,
+            timeout=(5, 30)
+        )
         return response.json()
     except requests.exceptions.RequestException as e:
         return {"error": str(e)}
@@ -522,68 +607,215 @@ TOOLS = [
 ]
 
 
+# Read-only tools whose results can be briefly cached (repeat clicks on
+# "Get Summary" etc. within seconds hit API Gateway + DynamoDB end-to-end)
+_READ_ONLY_TOOLS = {"list_tickets", "get_ticket", "get_ticket_summary"}
+_TOOL_CACHE_TTL = 10  # seconds
+
+
+@st.cache_resource
+def _tool_cache() -> dict:
+    """Process-wide store for cached read-only tool results."""
+    return {}
+
+
+# Assembled once so converse calls don't re-allocate the wrapper dicts on
+# every tool-loop iteration (botocore validation deep-copies the payload)
+_TOOL_CONFIG = {"tools": TOOLS}
+_CONVERSE_KWARGS_BASE = {
+    "toolConfig": _TOOL_CONFIG,
+    "inferenceConfig": {"maxTokens": 4096},
+}
+
+
 def execute_tool(tool_name: str, tool_input: dict) -> dict:
-    """Execute a tool call via the API Gateway."""
-    if tool_name == "list_tickets":
-        endpoint = "/tickets"
-        params = []
-        if tool_input.get("status"):
-            params.append(f"status={tool_input['status']}")
-        if tool_input.get("limit"):
-            params.append(f"limit={tool_input['limit']}")
-        if params:
-            endpoint += "?" + "&".join(params)
-        return call_ticket_api(endpoint)
-
-    elif tool_name == "create_ticket":
-        return call_ticket_api("/tickets", method="POST", data=tool_input)
-
-    elif tool_name == "get_ticket":
-        ticket_id = tool_input.get("ticket_id")
-        return call_ticket_api(f"/tickets/{ticket_id}")
-
-    elif tool_name == "update_ticket":
-        ticket_id = tool_input.pop("ticket_id", None)
-        if not ticket_id:
-            return {"error": "ticket_id is required"}
-        return call_ticket_api(f"/tickets/{ticket_id}", method="PATCH", data=tool_input)
-
-    elif tool_name == "get_ticket_summary":
-        # Get all tickets and compute summary
-        result = call_ticket_api("/tickets?limit=100")
-        if "error" in result:
-            return result
-
-        tickets = result.get("tickets", [])
-        summary = {
-            "total_tickets": len(tickets),
-            "by_status": {},
-            "by_priority": {},
-            "by_category": {}
-        }
+    """Execute a tool call via the API Gateway, caching read-only results."""
+    cache = _tool_cache()
+
+    if tool_name in _READ_ONLY_TOOLS:
+        if orjson is not None:
+            cache_key = (tool_name, orjson.dumps(tool_input, option=orjson.OPT_SORT_KEYS))
+        else:
+            cache_key = (tool_name, json.dumps(tool_input, sort_keys=True))
+        cached = cache.get(cache_key)
+        if cached is not None and time.time() - cached[0] < _TOOL_CACHE_TTL:
+            return cached[1]
+        result = _run_tool(tool_name, tool_input)
+        if "error" not in result:
+            cache[cache_key] = (time.time(), result)
+        return result
+
+    result = _run_tool(tool_name, tool_input)
+    # Writes invalidate cached reads so the next listing sees fresh data
+    if "error" not in result:
+        cache.clear()
+    return result
+
+
+def _tool_list_tickets(tool_input: dict) -> dict:
+    # urlencode handles escaping (e.g. "In Progress") in one C-level call
+    qs = urlencode(
+        {k: tool_input[k] for k in ("status", "limit") if tool_input.get(k)}
+    )
+    endpoint = f"/tickets?{qs}" if qs else "/tickets"
+    return call_ticket_api(endpoint)
+
+
+def _tool_create_ticket(tool_input: dict) -> dict:
+    return call_ticket_api("/tickets", method="POST", data=tool_input)
+
+
+def _tool_get_ticket(tool_input: dict) -> dict:
+    ticket_id = tool_input.get("ticket_id")
+    return call_ticket_api(f"/tickets/{ticket_id}")
+
+
+def _tool_update_ticket(tool_input: dict) -> dict:
+    ticket_id = tool_input.pop("ticket_id", None)
+    if not ticket_id:
+        return {"error": "ticket_id is required"}
+    return call_ticket_api(f"/tickets/{ticket_id}", method="PATCH", data=tool_input)
+
+
+def _tool_get_ticket_summary(tool_input: dict) -> dict:
+    # Get all tickets and compute summary
+    result = call_ticket_api("/tickets?limit=100")
+    if "error" in result:
+        return result
+
+    tickets = result.get("tickets", [])
+    # Counter runs the tally loop in C instead of per-ticket dict.get calls
+    summary = {
+        "total_tickets": len(tickets),
+        "by_status": dict(Counter(t.get("Status", "Unknown") for t in tickets)),
+        "by_priority": dict(Counter(t.get("Priority", "Unknown") for t in tickets)),
+        "by_category": dict(Counter(t.get("Category", "Unknown") for t in tickets)),
+    }
+
+    return {"success": True, "summary": summary, "tickets": tickets}
+
+
+def _unknown_tool(tool_name: str, tool_input: dict) -> dict:
+    return {"error": f"Unknown tool: {tool_name}"}
+
+
+# Dispatch table built once at import: O(1) lookup per tool call and new
+# tools only need an entry here plus their TOOLS schema
+_TOOL_HANDLERS = {
+    "list_tickets": _tool_list_tickets,
+    "create_ticket": _tool_create_ticket,
+    "get_ticket": _tool_get_ticket,
+    "update_ticket": _tool_update_ticket,
+    "get_ticket_summary": _tool_get_ticket_summary,
+}
+
+
+def _run_tool(tool_name: str, tool_input: dict) -> dict:
+    """Dispatch a tool call to the ticket API."""
+    handler = _TOOL_HANDLERS.get(tool_name)
+    if handler is None:
+        return _unknown_tool(tool_name, tool_input)
+    return handler(tool_input)
+
 
-        for ticket in tickets:
-            status = ticket.get("Status", "Unknown")
-            priority = ticket.get("Priority", "Unknown")
-            category = ticket.get("Category", "Unknown")
+# Approximate token budget for conversation history sent to Bedrock,
+# estimated at ~4 characters per token
+_HISTORY_TOKEN_BUDGET = 6000
 
-            summary["by_status"][status] = summary["by_status"].get(status, 0) + 1
-            summary["by_priority"][priority] = summary["by_priority"].get(priority, 0) + 1
-            summary["by_category"][category] = summary["by_category"].get(category, 0) + 1
 
-        return {"success": True, "summary": summary, "tickets": tickets}
+def _trim_history(messages, budget: int = _HISTORY_TOKEN_BUDGET) -> list:
+    """Select the most recent messages that fit an approximate token budget.
 
-    else:
-        return {"error": f"Unknown tool: {tool_name}"}
+    Walking from the newest message backwards bounds Bedrock input by
+    content size rather than a fixed message count, so a few very long
+    messages no longer blow up converse latency and cost.
+    """
+    selected = []
+    used = 0
+    for msg in reversed(messages):
+        cost = len(msg["content"]) // 4 + 1
+        if selected and used + cost > budget:
+            break
+        selected.append(msg)
+        used += cost
+    selected.reverse()
+    return selected
+
+
+def _stream_converse(bedrock_client, placeholder=None, **converse_kwargs) -> dict:
+    """Invoke converse_stream and re-assemble the full response message.
+
+    Text deltas are rendered into the given placeholder as they arrive
+    (batched to limit Streamlit rerender cost). Returns a dict shaped like
+    a non-streaming converse response so the tool-use loop is unchanged:
+    {"stopReason": ..., "output": {"message": {...}}}.
+    """
+    response = bedrock_client.converse_stream(**converse_kwargs)
+
+    content = []
+    current_text = None
+    current_tool = None
+    tool_input_json = ""
+    buffer = ""
+    pending_deltas = 0
+    stop_reason = None
+
+    for event in response["stream"]:
+        if "contentBlockStart" in event:
+            start = event["contentBlockStart"].get("start", {})
+            if "toolUse" in start:
+                current_tool = {
+                    "toolUseId": start["toolUse"]["toolUseId"],
+                    "name": start["toolUse"]["name"],
+                }
+                tool_input_json = ""
+        elif "contentBlockDelta" in event:
+            delta = event["contentBlockDelta"]["delta"]
+            if "text" in delta:
+                current_text = (current_text or "") + delta["text"]
+                buffer += delta["text"]
+                pending_deltas += 1
+                # Batch placeholder updates every few deltas
+                if placeholder is not None and pending_deltas >= 10:
+                    placeholder.markdown(buffer + "▌")
+                    pending_deltas = 0
+            elif "toolUse" in delta:
+                tool_input_json += delta["toolUse"].get("input", "")
+        elif "contentBlockStop" in event:
+            if current_tool is not None:
+                try:
+                    tool_input = json.loads(tool_input_json) if tool_input_json else {}
+                except json.JSONDecodeError:
+                    tool_input = {}
+                content.append({"toolUse": {**current_tool, "input": tool_input}})
+                current_tool = None
+            elif current_text is not None:
+                content.append({"text": current_text})
+                current_text = None
+        elif "messageStop" in event:
+            stop_reason = event["messageStop"].get("stopReason")
+
+    if current_text is not None:
+        content.append({"text": current_text})
+
+    return {
+        "stopReason": stop_reason,
+        "output": {"message": {"role": "assistant", "content": content}},
+    }
 
 
 def invoke_agent(prompt: str, model_id: str = "us.amazon.nova-pro-v1:0") -> str:
-    """Invoke the agent with tool use capability using Bedrock Converse API."""
+    """Invoke the agent with tool use capability, streaming the response.
+
+    Tokens are rendered incrementally into the current chat message via
+    converse_stream instead of blocking until the full response exists.
+    """
+    placeholder = st.empty()
     try:
         bedrock_client = get_bedrock_client()
         if bedrock_client is None:
             # No AWS credentials - show helpful message with setup instructions
-            return """**AWS Credentials Required**
+            no_credentials_msg = """**AWS Credentials Required**
 
 To enable the AI agent, you need to configure AWS credentials in Streamlit Cloud:
 
@@ -602,6 +834,8 @@ In the meantime, you can still:
 - Click **List Tickets** to view existing tickets via the API
 
 The ticket API works without AWS credentials since it uses the public API Gateway endpoint."""
+            placeholder.markdown(no_credentials_msg)
+            return no_credentials_msg
 
         # Retrieve long-term memory context if enabled
         memory_context = ""
@@ -613,7 +847,7 @@ The ticket API works without AWS credentials since it uses the public API Gatewa
         # Build conversation history for Converse API
         # Must start with user message, so we filter and ensure proper alternation
         messages = []
-        history = st.session_state.messages[-10:]
+        history = _trim_history(st.session_state.messages)
 
         # Find first user message in history
         start_idx = 0
@@ -646,55 +880,69 @@ The ticket API works without AWS credentials since it uses the public API Gatewa
         while len(messages) >= 2 and messages[-1]["role"] == "user" and messages[-2]["role"] == "user":
             messages.pop(-2)
 
-        # First call with tools using Converse API
-        response = bedrock_client.converse(
+        # Build the system block once per turn; the constant block is reused
+        # when there is no memory context
+        if memory_context:
+            system_block = [{"text": get_system_prompt(memory_context)}]
+        else:
+            system_block = _SYSTEM_PROMPT_BLOCK
+
+        # First call with tools, streaming tokens into the placeholder
+        response = _stream_converse(
+            bedrock_client,
+            placeholder,
             modelId=model_id,
             messages=messages,
-            system=[{"text": get_system_prompt(memory_context)}],
-            toolConfig={"tools": TOOLS},
-            inferenceConfig={"maxTokens": 4096}
+            system=system_block,
+            **_CONVERSE_KWARGS_BASE,
         )
 
         # Handle tool use loop
         while response.get("stopReason") == "tool_use":
-            tool_results = []
             assistant_content = response["output"]["message"]["content"]
 
-            # Process each tool use block
-            for content_block in assistant_content:
-                if "toolUse" in content_block:
-                    tool_use = content_block["toolUse"]
-                    tool_name = tool_use["name"]
-                    tool_input = tool_use.get("input", {})
-                    tool_use_id = tool_use["toolUseId"]
-
-                    # Show tool execution in sidebar
-                    st.session_state.tool_results.append({
-                        "tool": tool_name,
-                        "input": tool_input
-                    })
-
-                    # Execute the tool
-                    result = execute_tool(tool_name, tool_input)
-
-                    tool_results.append({
-                        "toolResult": {
-                            "toolUseId": tool_use_id,
-                            "content": [{"json": result}]
-                        }
-                    })
+            # Collect all tool use blocks for this turn
+            tool_uses = [
+                block["toolUse"] for block in assistant_content if "toolUse" in block
+            ]
+
+            # Show tool executions in sidebar
+            for tool_use in tool_uses:
+                st.session_state.tool_results.append({
+                    "tool": tool_use["name"],
+                    "input": tool_use.get("input", {})
+                })
+
+            # Execute independent tool calls concurrently; executor.map
+            # preserves order so toolUseIds stay matched to their results
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                results = list(executor.map(
+                    lambda tu: execute_tool(tu["name"], tu.get("input", {})),
+                    tool_uses,
+                ))
+
+            tool_results = [
+                {
+                    "toolResult": {
+                        "toolUseId": tool_use["toolUseId"],
+                        "content": [{"json": result}]
+                    }
+                }
+                for tool_use, result in zip(tool_uses, results)
+            ]
 
             # Add assistant response and tool results to messages
             messages.append({"role": "assistant", "content": assistant_content})
             messages.append({"role": "user", "content": tool_results})
 
             # Continue conversation
-            response = bedrock_client.converse(
+            response = _stream_converse(
+                bedrock_client,
+                placeholder,
                 modelId=model_id,
                 messages=messages,
-                system=[{"text": get_system_prompt(memory_context)}],
-                toolConfig={"tools": TOOLS},
-                inferenceConfig={"maxTokens": 4096}
+                system=system_block,
+                **_CONVERSE_KWARGS_BASE,
             )
 
         # Extract final text response
@@ -705,12 +953,13 @@ The ticket API works without AWS credentials since it uses the public API Gatewa
 
         # Clean up any thinking tags that Nova sometimes includes
         if "<thinking>" in final_response:
-            # Remove thinking tags content
-            import re
-            final_response = re.sub(r'<thinking>.*?</thinking>\s*', '', final_response, flags=re.DOTALL)
+            final_response = _THINKING_RE.sub('', final_response)
 
         final_text = final_response.strip()
 
+        # Replace the streamed draft with the cleaned final text
+        placeholder.markdown(final_text)
+
         # Store conversation event in AgentCore Memory (short-term memory)
         # This happens asynchronously and doesn't block the response
         if st.session_state.get("memory_enabled", True) and final_text:
@@ -726,12 +975,17 @@ The ticket API works without AWS credentials since it uses the public API Gatewa
     except ClientError as e:
         error_msg = f"Error invoking Bedrock: {e.response['Error']['Message']}"
         st.error(error_msg)
-        return f"I apologize, but I encountered an error: {error_msg}"
+        reply = f"I apologize, but I encountered an error: {error_msg}"
+        placeholder.markdown(reply)
+        return reply
     except Exception as e:
         st.error(f"Unexpected error: {str(e)}")
-        return f"I apologize, but I encountered an unexpected error: {str(e)}"
+        reply = f"I apologize, but I encountered an unexpected error: {str(e)}"
+        placeholder.markdown(reply)
+        return reply
 
 
+@st.fragment
 def render_sidebar():
     """Render the sidebar with controls and information."""
     with st.sidebar:
@@ -748,13 +1002,17 @@ def render_sidebar():
         # AgentCore status
         st.subheader("Status")
 
-        # Check Bedrock availability
-        bedrock_available = get_bedrock_client() is not None
-        if bedrock_available:
+        # Bedrock availability is probed once in init_session_state; the
+        # badge just reads the cached flag on reruns
+        if st.session_state.bedrock_available:
             st.success("AI Agent: Available")
         else:
             st.warning("AI Agent: No credentials")
             st.caption("Configure AWS secrets to enable")
+            if st.button("🔁 Recheck credentials", use_container_width=True):
+                _aws_credentials_available.clear()
+                st.session_state.bedrock_available = get_bedrock_client() is not None
+                st.rerun()
 
         # Debug info (expandable)
         with st.expander("🔧 Debug Info"):
@@ -835,12 +1093,16 @@ def render_sidebar():
 
         if st.button("📊 Get Summary", use_container_width=True):
             st.session_state.pending_action = "Get ticket summary"
+            # Pending actions are consumed by render_chat, which lives
+            # outside this fragment, so escalate to a full-app rerun
+            st.rerun(scope="app")
 
         if st.button("📋 List Tickets", use_container_width=True):
             st.session_state.pending_action = "Show all tickets"
+            st.rerun(scope="app")
 
         if st.button("🔄 Clear Chat", use_container_width=True):
-            st.session_state.messages = []
+            st.session_state.messages = deque(maxlen=_HISTORY_MAXLEN)
             st.session_state.tool_results = []
             st.session_state.memory_errors = []
             st.rerun()
@@ -914,6 +1176,28 @@ def render_sidebar():
             """)
 
 
+@st.fragment
+def _render_history():
+    """Render the most recent page of the chat transcript.
+
+    Isolated in a fragment so sidebar and widget interactions don't
+    re-markdown every historical message on each rerun. Only the last
+    _HISTORY_PAGE messages are shown, with a button to page backwards.
+    """
+    messages = st.session_state.messages
+    visible = st.session_state.get("history_visible", _HISTORY_PAGE)
+
+    hidden = len(messages) - visible
+    if hidden > 0:
+        if st.button(f"⬆️ Load earlier messages ({hidden} hidden)"):
+            st.session_state.history_visible = visible + _HISTORY_PAGE
+            st.rerun(scope="fragment")
+
+    for message in islice(messages, max(hidden, 0), None):
+        with st.chat_message(message["role"]):
+            st.markdown(message["content"])
+
+
 def render_chat():
     """Render the main chat interface."""
     st.title("🤖 MSP Support Assistant")
@@ -937,10 +1221,7 @@ def render_chat():
 
     st.markdown("---")
 
-    # Display chat messages
-    for message in st.session_state.messages:
-        with st.chat_message(message["role"]):
-            st.markdown(message["content"])
+    _render_history()
 
     # Handle pending action from buttons
     if hasattr(st.session_state, "pending_action") and st.session_state.pending_action:
@@ -952,11 +1233,9 @@ def render_chat():
         with st.chat_message("user"):
             st.markdown(prompt)
 
-        # Generate response
+        # Generate response (invoke_agent streams into the chat message)
         with st.chat_message("assistant"):
-            with st.spinner("Thinking..."):
-                response = invoke_agent(prompt)
-                st.markdown(response)
+            response = invoke_agent(prompt)
 
         # Add assistant message
         st.session_state.messages.append({"role": "assistant", "content": response})
@@ -969,18 +1248,38 @@ def render_chat():
         with st.chat_message("user"):
             st.markdown(prompt)
 
-        # Generate response
+        # Generate response (invoke_agent streams into the chat message)
         with st.chat_message("assistant"):
-            with st.spinner("Thinking..."):
-                response = invoke_agent(prompt)
-                st.markdown(response)
+            response = invoke_agent(prompt)
 
         # Add assistant message
         st.session_state.messages.append({"role": "assistant", "content": response})
 
 
+@st.cache_resource
+def _start_warmup() -> bool:
+    """Kick off Bedrock/SSM client construction on a background thread.
+
+    Both sit behind st.cache_resource, so the first chat turn picks up the
+    already-warm clients instead of paying ~300-500 ms of boto3 client
+    construction each. cache_resource makes this a one-shot per server.
+    """
+    import threading
+
+    def _warmup():
+        try:
+            get_bedrock_client()
+            load_config_from_ssm()
+        except Exception:
+            pass
+
+    threading.Thread(target=_warmup, daemon=True, name="client-warmup").start()
+    return True
+
+
 def main():
     """Main application entry point."""
+    _start_warmup()
     init_session_state()
     render_sidebar()
     render_chat()
@@ -8,12 +8,42 @@ AWS Bedrock AgentCore with Strands SDK.
 import json
 import os
 import time
+from functools import lru_cache
 from typing import Optional
+from urllib.parse import urlencode
 
-import boto3
-import requests
 import streamlit as st
-from botocore.exceptions import ClientError
+
+# boto3 itself is imported lazily in _bedrock_client (its import graph
+# costs hundreds of ms and is not needed until the first chat turn)
+try:
+    from botocore.exceptions import ClientError
+except ImportError:
+    class ClientError(Exception):
+        """Placeholder so except clauses work when boto3 is not installed."""
+
+# Ticket API plumbing shared with the AgentCore app
+from api_client import API_GATEWAY_ENDPOINT, request_json
+
+# orjson is optional: JSON hot paths fall back to the stdlib when the
+# faster library isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _json_dumps(obj) -> str:
+    return orjson.dumps(obj).decode() if orjson is not None else json.dumps(obj)
+
+
+def _json_dumps_bytes(obj) -> bytes:
+    return orjson.dumps(obj) if orjson is not None else json.dumps(obj).encode()
+
 
 # Page configuration
 st.set_page_config(
@@ -25,21 +55,63 @@ st.set_page_config(
 
 # Environment configuration
 AWS_REGION = os.environ.get("AWS_REGION", "us-east-1")
-API_GATEWAY_ENDPOINT = os.environ.get("API_GATEWAY_ENDPOINT", "https://p3h9ge8d92.execute-api.us-east-1.amazonaws.com")
 ENVIRONMENT = os.environ.get("ENVIRONMENT", "demo")
 
+# Bedrock latency-optimized inference (supported for Anthropic models only);
+# set BEDROCK_LATENCY_OPTIMIZED=0 to fall back to standard inference
+BEDROCK_LATENCY_OPTIMIZED = os.environ.get("BEDROCK_LATENCY_OPTIMIZED", "1") == "1"
+
+
+@st.cache_resource
+def get_executor():
+    """Shared thread pool for running independent API calls in parallel."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    return ThreadPoolExecutor(max_workers=8)
+
+
+def run_parallel(*calls, timeout: int = 30) -> list:
+    """Run independent no-arg callables concurrently and return their results.
+
+    Synchronous stand-in for asyncio.gather: the calls overlap on the
+    shared thread pool (socket waits release the GIL), so N independent
+    round-trips cost roughly one RTT window instead of N.
+    """
+    futures = [get_executor().submit(call) for call in calls]
+    return [future.result(timeout=timeout) for future in futures]
+
+
+@st.cache_resource
+def _bedrock_client():
+    """Process-wide Bedrock runtime client with a tuned connection pool.
+
+    A per-session client would cap out at botocore's default 10 pooled
+    connections and re-handshake for every browser tab; one shared client
+    with keepalive serves all sessions on this server.
+    """
+    import boto3
+    from botocore.config import Config
+
+    return boto3.client(
+        "bedrock-runtime",
+        region_name=AWS_REGION,
+        config=Config(
+            max_pool_connections=50,
+            tcp_keepalive=True,
+            retries={"max_attempts": 5, "mode": "adaptive"},
+            connect_timeout=3,
+            read_timeout=60,
+        ),
+    )
+
 
 def get_bedrock_client():
-    """Get or create Bedrock runtime client (lazy initialization)."""
-    if "bedrock_client" not in st.session_state:
-        try:
-            st.session_state.bedrock_client = boto3.client(
-                "bedrock-runtime", region_name=AWS_REGION
-            )
-        except Exception as e:
-            st.error(f"Failed to initialize Bedrock client: {e}")
-            return None
-    return st.session_state.bedrock_client
+    """Get the shared Bedrock runtime client (None if construction fails)."""
+    try:
+        return _bedrock_client()
+    except Exception as e:
+        st.error(f"Failed to initialize Bedrock client: {e}")
+        return None
 
 
 def init_session_state():
@@ -48,13 +120,16 @@ def init_session_state():
         st.session_state.messages = []
     if "session_id" not in st.session_state:
         st.session_state.session_id = f"session-{int(time.time())}"
-    if "tickets" not in st.session_state:
-        st.session_state.tickets = []
+    if "tickets_arrow" not in st.session_state:
+        # Ticket listings are held as an Arrow table: smaller than a list
+        # of dicts and consumed zero-copy by st.dataframe
+        st.session_state.tickets_arrow = None
+    # Bedrock-shaped message payloads, maintained incrementally so each
+    # turn appends one dict instead of rebuilding the whole list
+    st.session_state.setdefault("bedrock_messages", [])
 
 
-def get_system_prompt() -> str:
-    """Get the system prompt for the agent."""
-    return """You are an intelligent MSP (Managed Service Provider) Support Assistant.
+SYSTEM_PROMPT = """You are an intelligent MSP (Managed Service Provider) Support Assistant.
 Your role is to help users manage support tickets through natural conversation.
 
 You can help with:
@@ -73,74 +148,277 @@ Always be helpful, professional, and efficient. If you need more information, as
 Format ticket information clearly when displaying it."""
 
 
-def invoke_bedrock_model(prompt: str, model_id: str = "anthropic.claude-3-sonnet-20240229-v1:0") -> str:
-    """Invoke Bedrock model for response generation."""
+def get_system_prompt() -> str:
+    """Get the system prompt for the agent."""
+    return SYSTEM_PROMPT
+
+
+# Approximate input-token budget for conversation history sent to Bedrock,
+# estimated at ~4 characters per token
+_HISTORY_TOKEN_BUDGET = 3000
+
+
+def _trim_history(messages, budget: int = _HISTORY_TOKEN_BUDGET) -> list:
+    """Select the most recent messages that fit an approximate token budget.
+
+    Walking from the newest message backwards bounds Bedrock input by
+    content size rather than a fixed message count, so a few very long
+    messages no longer inflate prefill latency and cost every turn.
+    """
+    selected = []
+    used = 0
+    for msg in reversed(messages):
+        content = msg["content"]
+        if isinstance(content, str):
+            chars = len(content)
+        else:
+            chars = sum(len(block.get("text", "")) for block in content)
+        cost = chars // 4 + 1
+        if selected and used + cost > budget:
+            break
+        selected.append(msg)
+        used += cost
+    selected.reverse()
+    # Anthropic payloads must open with a user turn; trimming on budget
+    # alone can leave an assistant message first, which Bedrock rejects
+    while selected and selected[0]["role"] != "user":
+        selected.pop(0)
+    return selected
+
+
+# Model tiers for routing: the sidebar has always advertised "Titan for
+# simple questions", this actually implements it
+TITAN_MODEL = "amazon.titan-text-lite-v1"
+HAIKU_MODEL = "anthropic.claude-3-haiku-20240307-v1:0"
+SONNET_MODEL = "anthropic.claude-3-sonnet-20240229-v1:0"
+
+
+def choose_model(prompt: str, history_len: int) -> str:
+    """Pick the cheapest model tier that can handle the prompt.
+
+    Short openers go to Titan Text Lite, short follow-ups to Haiku, and
+    everything else to Sonnet — most turns never pay Sonnet latency/cost.
+    """
+    if len(prompt) < 120 and history_len < 2:
+        return TITAN_MODEL
+    if len(prompt) < 200:
+        return HAIKU_MODEL
+    return SONNET_MODEL
+
+
+@lru_cache(maxsize=4)
+def _anthropic_body_prefix(max_tokens: int) -> bytes:
+    """Serialized static portion of the Anthropic request body.
+
+    The API version, token cap and system prompt never change at runtime,
+    so serialize them once per token cap and splice the per-turn messages
+    in as raw bytes instead of re-encoding the whole body every call.
+    """
+    return _json_dumps_bytes({
+        "anthropic_version": "bedrock-2023-05-31",
+        "max_tokens": max_tokens,
+        "system": SYSTEM_PROMPT,
+    })
+
+
+# Sentinel closing the chunk queue (text chunks themselves can be falsy)
+_STREAM_DONE = object()
+
+
+def _bedrock_text_stream(bedrock_client, invoke_kwargs: dict):
+    """Yield text deltas from a Bedrock response stream.
+
+    Touches no session state, so it is safe to drain on a worker thread.
+    """
+    response = bedrock_client.invoke_model_with_response_stream(**invoke_kwargs)
+
+    for event in response["body"]:
+        chunk = _json_loads(event["chunk"]["bytes"])
+        if chunk.get("type") == "content_block_delta":
+            # Anthropic event-stream delta
+            text = chunk.get("delta", {}).get("text")
+            if text:
+                yield text
+        elif chunk.get("outputText"):
+            # Titan event-stream delta
+            yield chunk["outputText"]
+
+
+def _drain_on_executor(generator):
+    """Drain a generator on the shared thread pool, re-yielding its items.
+
+    The Bedrock socket reads happen on a worker thread (the GIL is
+    released in recv), so other sessions' reruns can interleave while
+    this chat turn streams; chunks cross back over a bounded queue.
+    """
+    import queue
+
+    chunks = queue.Queue(maxsize=64)
+
+    def pump():
+        try:
+            for item in generator:
+                chunks.put(item)
+        except BaseException as exc:
+            chunks.put(exc)
+        finally:
+            chunks.put(_STREAM_DONE)
+
+    get_executor().submit(pump)
+    while True:
+        item = chunks.get()
+        if item is _STREAM_DONE:
+            break
+        if isinstance(item, BaseException):
+            raise item
+        yield item
+
+
+def invoke_bedrock_model_stream(prompt: str, model_id: Optional[str] = None):
+    """Invoke a Bedrock model and yield response text chunks as they arrive.
+
+    Streaming means the first tokens appear after roughly one round-trip
+    instead of after the full generation, so perceived chat latency drops
+    sharply while total wall time stays the same or better. The request
+    body is built here (session state is script-thread-only); the network
+    wait runs on the shared pool.
+    """
     try:
         bedrock_client = get_bedrock_client()
         if bedrock_client is None:
-            return "I apologize, but the AI service is not available at the moment. Please try again later."
-
-        # Build conversation history
-        messages = []
-        for msg in st.session_state.messages[-10:]:  # Last 10 messages for context
-            messages.append({
-                "role": msg["role"],
-                "content": [{"type": "text", "text": msg["content"]}]
+            yield "I apologize, but the AI service is not available at the moment. Please try again later."
+            return
+
+        if model_id is None:
+            model_id = choose_model(prompt, len(st.session_state.messages))
+
+        if model_id.startswith("anthropic."):
+            # The payload list is maintained incrementally in session
+            # state (current prompt included); just trim it to budget
+            messages = _trim_history(st.session_state.bedrock_messages)
+
+            # Splice messages into the pre-serialized static prefix;
+            # invoke_model accepts a bytes body directly
+            prefix = _anthropic_body_prefix(2048 if model_id == SONNET_MODEL else 512)
+            body = prefix[:-1] + b',"messages":' + _json_dumps_bytes(messages) + b"}"
+        else:
+            # Titan takes a flat prompt rather than an Anthropic message list
+            body = _json_dumps({
+                "inputText": f"{get_system_prompt()}\n\nUser: {prompt}\nAssistant:",
+                "textGenerationConfig": {"maxTokenCount": 512, "temperature": 0.7},
             })
 
-        # Add current message
-        messages.append({
-            "role": "user",
-            "content": [{"type": "text", "text": prompt}]
-        })
-
-        body = {
-            "anthropic_version": "bedrock-2023-05-31",
-            "max_tokens": 2048,
-            "system": get_system_prompt(),
-            "messages": messages,
-        }
-
-        response = bedrock_client.invoke_model(
-            modelId=model_id,
-            body=json.dumps(body),
-        )
+        invoke_kwargs = {"modelId": model_id, "body": body}
+        if BEDROCK_LATENCY_OPTIMIZED and model_id.startswith("anthropic."):
+            invoke_kwargs["performanceConfigLatency"] = "optimized"
 
-        response_body = json.loads(response["body"].read())
-        return response_body["content"][0]["text"]
+        yield from _drain_on_executor(
+            _bedrock_text_stream(bedrock_client, invoke_kwargs)
+        )
 
     except ClientError as e:
         error_msg = f"Error invoking Bedrock: {e.response['Error']['Message']}"
         st.error(error_msg)
-        return f"I apologize, but I encountered an error: {error_msg}"
+        yield f"I apologize, but I encountered an error: {error_msg}"
     except Exception as e:
         st.error(f"Unexpected error: {str(e)}")
-        return f"I apologize, but I encountered an unexpected error. Please try again."
+        yield "I apologize, but I encountered an unexpected error. Please try again."
+
+
+def _do_request(method: str, endpoint: str, data: Optional[dict]) -> dict:
+    """Perform one HTTP request against the Ticket API."""
+    return request_json(method, endpoint, data)
+
+
+class _TicketAPIError(Exception):
+    """Raised inside cached GETs so transport failures are not memoized."""
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_get(endpoint: str) -> dict:
+    """GET with a 30 s shared cache so reruns don't re-hit API Gateway.
+
+    Failures are raised instead of returned: st.cache_data does not
+    memoize exceptions, so one bad request (or a circuit-breaker
+    fast-fail) is not served for the full TTL after recovery.
+    """
+    result = _do_request("GET", endpoint, None)
+    if "error" in result:
+        raise _TicketAPIError(result["error"])
+    return result
+
+
+# Micro-batch cap: keeps answer quality stable while still amortizing the
+# system prompt and HTTPS round-trip across the batch
+_MAX_BATCH_QUERIES = 8
+
+
+def batch_invoke_bedrock(prompts: list, model_id: str = SONNET_MODEL) -> list:
+    """Answer several independent queries in one model invocation.
+
+    One invocation with numbered queries pays the system-prompt tokens
+    and the Bedrock round-trip once instead of per query. Returns one
+    answer string per prompt (empty strings if the batch fails), intended
+    for flows like per-ticket summaries on a listing.
+    """
+    if not prompts:
+        return []
+    if len(prompts) > _MAX_BATCH_QUERIES:
+        return (
+            batch_invoke_bedrock(prompts[:_MAX_BATCH_QUERIES], model_id)
+            + batch_invoke_bedrock(prompts[_MAX_BATCH_QUERIES:], model_id)
+        )
+
+    bedrock_client = get_bedrock_client()
+    if bedrock_client is None:
+        return ["" for _ in prompts]
+
+    numbered = "\n".join(f"{i + 1}) {p}" for i, p in enumerate(prompts))
+    question = (
+        f"Answer each of the following {len(prompts)} queries. Respond with "
+        f'JSON only, shaped {{"answers": ["answer 1", ...]}}:\n{numbered}\n'
+    )
+    body = {
+        "anthropic_version": "bedrock-2023-05-31",
+        "max_tokens": 2048,
+        "system": SYSTEM_PROMPT,
+        "messages": [
+            {"role": "user", "content": [{"type": "text", "text": question}]}
+        ],
+    }
+
+    try:
+        response = bedrock_client.invoke_model(modelId=model_id, body=_json_dumps(body))
+        text = _json_loads(response["body"].read())["content"][0]["text"]
+        payload = text[text.index("{"):text.rindex("}") + 1]
+        answers = [str(a) for a in json.loads(payload).get("answers", [])]
+    except (ClientError, ValueError, KeyError):
+        return ["" for _ in prompts]
+
+    # Pad/trim so callers can zip answers against their prompts
+    answers += [""] * (len(prompts) - len(answers))
+    return answers[:len(prompts)]
 
 
 def call_ticket_api(method: str, endpoint: str, data: Optional[dict] = None) -> dict:
-    """Call the Ticket API."""
+    """Call the Ticket API (GETs are cached; writes invalidate the cache)."""
     if not API_GATEWAY_ENDPOINT:
         return {"error": "API Gateway endpoint not configured"}
 
-    url = f"{API_GATEWAY_ENDPOINT.rstrip('/')}{endpoint}"
-    headers = {"Content-Type": "application/json"}
+    if method not in ("GET", "POST", "PATCH", "DELETE"):
+        return {"error": f"Unsupported method: {method}"}
 
-    try:
-        if method == "GET":
-            response = requests.get(url, headers=headers, timeout=30)
-        elif method == "POST":
-            response = requests.post(url, headers=headers, json=data, timeout=30)
-        elif method == "PATCH":
-            response = requests.patch(url, headers=headers, json=data, timeout=30)
-        elif method == "DELETE":
-            response = requests.delete(url, headers=headers, timeout=30)
-        else:
-            return {"error": f"Unsupported method: {method}"}
+    if method == "GET":
+        try:
+            return _cached_get(endpoint)
+        except _TicketAPIError as e:
+            return {"error": str(e)}
 
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        return {"error": str(e)}
+    result = _do_request(method, endpoint, data)
+    if "error" not in result:
+        # A successful write means cached listings are stale
+        _cached_get.clear()
+    return result
 
 
 def create_ticket_from_conversation(title: str, description: str, priority: str = "Medium", category: str = "General") -> dict:
@@ -159,12 +437,16 @@ def get_ticket(ticket_id: str) -> dict:
     return call_ticket_api("GET", f"/tickets/{ticket_id}")
 
 
-def list_tickets(status: Optional[str] = None, limit: int = 10) -> dict:
-    """List tickets with optional filters."""
-    endpoint = f"/tickets?limit={limit}"
+def list_tickets(status: Optional[str] = None, limit: int = 10, last_key: Optional[str] = None) -> dict:
+    """List tickets with optional filters and cursor pagination."""
+    params = {"limit": limit}
     if status:
-        endpoint += f"&status={status}"
-    return call_ticket_api("GET", endpoint)
+        params["status"] = status
+    if last_key:
+        params["lastKey"] = last_key
+    # urlencode escapes values like "In Progress" that would otherwise
+    # produce a malformed URL and a wasted 4xx round-trip
+    return call_ticket_api("GET", "/tickets?" + urlencode(params))
 
 
 def update_ticket(ticket_id: str, updates: dict) -> dict:
@@ -172,8 +454,46 @@ def update_ticket(ticket_id: str, updates: dict) -> dict:
     return call_ticket_api("PATCH", f"/tickets/{ticket_id}", updates)
 
 
+# Display formatting tables, built once at import and applied as single
+# vectorized .map() calls instead of per-row branching
+STATUS_EMOJI = {
+    "Open": "🟢 Open",
+    "In Progress": "🟡 In Progress",
+    "Resolved": "🟣 Resolved",
+    "Closed": "⚪ Closed",
+}
+PRIORITY_EMOJI = {
+    "Low": "🔵 Low",
+    "Medium": "🟡 Medium",
+    "High": "🟠 High",
+    "Critical": "🔴 Critical",
+}
+
+
+@st.cache_data(show_spinner=False)
+def _tickets_dataframe(tickets: list):
+    """Build the display DataFrame for the sidebar ticket table.
+
+    One Arrow-serialized table per rerun replaces a Python loop of
+    per-ticket widgets, so render cost stays flat as the list grows.
+    """
+    import pandas as pd
+
+    df = pd.DataFrame(tickets).reindex(
+        columns=["TicketId", "Title", "Status", "Priority"]
+    )
+    df["Status"] = df["Status"].map(STATUS_EMOJI).fillna(df["Status"])
+    df["Priority"] = df["Priority"].map(PRIORITY_EMOJI).fillna(df["Priority"])
+    return df
+
+
+@st.fragment
 def render_sidebar():
-    """Render the sidebar with controls and information."""
+    """Render the sidebar with controls and information.
+
+    A fragment, so sidebar clicks rerun only this region instead of
+    replaying the whole chat transcript.
+    """
     with st.sidebar:
         st.title("🎫 MSP Support")
         st.markdown("---")
@@ -190,30 +510,98 @@ def render_sidebar():
 
         if st.button("📋 List Open Tickets", use_container_width=True):
             with st.spinner("Fetching tickets..."):
-                result = list_tickets(status="Open")
+                # The open listing and the summary are independent
+                # round-trips; overlapping them collapses the click into
+                # one RTT, and the summary carries the real ticket total
+                result, summary_result = run_parallel(
+                    lambda: list_tickets(status="Open"),
+                    lambda: call_ticket_api("GET", "/tickets/summary"),
+                )
                 if "error" in result:
                     st.error(result["error"])
                 else:
-                    st.session_state.tickets = result.get("tickets", [])
-                    if st.session_state.tickets:
-                        st.success(f"Found {len(st.session_state.tickets)} open tickets")
+                    import pyarrow as pa
+
+                    tickets = result.get("tickets", [])
+                    st.session_state.tickets_arrow = (
+                        pa.Table.from_pylist(tickets) if tickets else None
+                    )
+                    # Cursor for fetching the next page lazily
+                    st.session_state.tickets_cursor = result.get("lastKey")
+                    # Suggestions belong to the previous listing
+                    st.session_state.ticket_suggestions = []
+                    if tickets:
+                        total = summary_result.get("summary", {}).get(
+                            "total_tickets", "?"
+                        )
+                        st.success(
+                            f"Found {len(tickets)} open tickets "
+                            f"({total} in total)"
+                        )
                     else:
                         st.info("No open tickets found")
 
         if st.button("🔄 Clear Chat", use_container_width=True):
             st.session_state.messages = []
+            st.session_state.bedrock_messages = []
             st.rerun()
 
         st.markdown("---")
 
         # Recent tickets display
-        if st.session_state.tickets:
+        if st.session_state.tickets_arrow is not None:
             st.subheader("Recent Tickets")
-            for ticket in st.session_state.tickets[:5]:
-                with st.expander(f"🎫 {ticket.get('TicketId', 'N/A')[:15]}..."):
-                    st.write(f"**Title:** {ticket.get('Title', 'N/A')}")
-                    st.write(f"**Status:** {ticket.get('Status', 'N/A')}")
-                    st.write(f"**Priority:** {ticket.get('Priority', 'N/A')}")
+            st.dataframe(
+                _tickets_dataframe(st.session_state.tickets_arrow.to_pylist()),
+                hide_index=True,
+                use_container_width=True,
+                height=220,
+                column_config={
+                    "TicketId": st.column_config.TextColumn(width="small"),
+                },
+            )
+
+            # Fetch the next page only when asked, so the response size
+            # per round-trip stays bounded as the table grows
+            if st.session_state.get("tickets_cursor"):
+                if st.button("⬇️ Load more", use_container_width=True):
+                    import pyarrow as pa
+
+                    more = list_tickets(
+                        status="Open", last_key=st.session_state.tickets_cursor
+                    )
+                    if "error" in more:
+                        st.error(more["error"])
+                    else:
+                        st.session_state.tickets_cursor = more.get("lastKey")
+                        page = more.get("tickets", [])
+                        if page:
+                            st.session_state.tickets_arrow = pa.concat_tables([
+                                st.session_state.tickets_arrow,
+                                pa.Table.from_pylist(page),
+                            ])
+                        st.rerun(scope="fragment")
+
+            # Enrich the visible tickets with next-step suggestions via
+            # one batched invocation instead of a model call per row
+            if st.button("💡 Suggest next steps", use_container_width=True):
+                rows = st.session_state.tickets_arrow.to_pylist()[:_MAX_BATCH_QUERIES]
+                prompts = [
+                    f"Suggest one next action for this support ticket: "
+                    f"{row.get('Title', '')} (status {row.get('Status', 'Unknown')}, "
+                    f"priority {row.get('Priority', 'Unknown')}). One sentence."
+                    for row in rows
+                ]
+                with st.spinner("Analyzing tickets..."):
+                    answers = batch_invoke_bedrock(prompts)
+                st.session_state.ticket_suggestions = [
+                    (row.get("TicketId", "?"), answer)
+                    for row, answer in zip(rows, answers)
+                    if answer
+                ]
+
+            for ticket_id, suggestion in st.session_state.get("ticket_suggestions", []):
+                st.caption(f"**{ticket_id}**: {suggestion}")
 
         st.markdown("---")
 
@@ -248,19 +636,24 @@ def render_chat():
     if prompt := st.chat_input("How can I help you today?"):
         # Add user message
         st.session_state.messages.append({"role": "user", "content": prompt})
+        st.session_state.bedrock_messages.append(
+            {"role": "user", "content": [{"type": "text", "text": prompt}]}
+        )
         with st.chat_message("user"):
             st.markdown(prompt)
 
-        # Generate response
+        # Generate response, rendering tokens as they stream in
         with st.chat_message("assistant"):
-            with st.spinner("Thinking..."):
-                response = invoke_bedrock_model(prompt)
-                st.markdown(response)
+            response = st.write_stream(invoke_bedrock_model_stream(prompt))
 
         # Add assistant message
         st.session_state.messages.append({"role": "assistant", "content": response})
+        st.session_state.bedrock_messages.append(
+            {"role": "assistant", "content": [{"type": "text", "text": response}]}
+        )
 
 
+@st.fragment
 def render_ticket_form():
     """Render quick ticket creation form."""
     st.markdown("---")
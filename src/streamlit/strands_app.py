@@ -21,48 +21,18 @@ Usage:
 """
 
 import os
+import re
 import time
+from collections import deque
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
-import boto3
 import requests
 import streamlit as st
-from botocore.exceptions import ClientError
-
-# Strands Agents SDK imports
-try:
-    from strands import Agent
-    from strands.models import BedrockModel
-    STRANDS_AVAILABLE = True
-except ImportError:
-    STRANDS_AVAILABLE = False
-    Agent = None
-    BedrockModel = None
-
-# AgentCore Memory SDK imports
-try:
-    from bedrock_agentcore.memory.integrations.strands.config import (
-        AgentCoreMemoryConfig,
-        RetrievalConfig
-    )
-    from bedrock_agentcore.memory.integrations.strands.session_manager import (
-        AgentCoreMemorySessionManager
-    )
-    AGENTCORE_SDK_AVAILABLE = True
-except ImportError:
-    AGENTCORE_SDK_AVAILABLE = False
-    AgentCoreMemoryConfig = None
-    RetrievalConfig = None
-    AgentCoreMemorySessionManager = None
-
-# Import our ticket management tools
-try:
-    from tools import TICKET_TOOLS, list_tickets, create_ticket, get_ticket, update_ticket, get_ticket_summary
-    TOOLS_AVAILABLE = True
-except ImportError:
-    TOOLS_AVAILABLE = False
-    TICKET_TOOLS = []
+
+# Shared pooled HTTP client (same module the other Streamlit apps use)
+from api_client import API_BASE as _API_BASE, get_http_session, request_json
 
 # Page configuration
 st.set_page_config(
@@ -73,18 +43,29 @@ st.set_page_config(
 )
 
 # Load AWS credentials from Streamlit secrets (for Streamlit Cloud)
-_credentials_loaded = []
-try:
-    if hasattr(st, 'secrets') and len(st.secrets) > 0:
-        for key in ['AWS_ACCESS_KEY_ID', 'AWS_SECRET_ACCESS_KEY', 'AWS_SESSION_TOKEN', 'AWS_DEFAULT_REGION']:
-            if key in st.secrets:
-                value = st.secrets[key]
-                if isinstance(value, str):
-                    value = value.strip().strip('"').strip("'")
-                os.environ[key] = value
-                _credentials_loaded.append(key)
-except Exception:
-    pass
+@st.cache_resource
+def _hydrate_env() -> list:
+    """Copy AWS credentials from st.secrets into os.environ, once.
+
+    Parsing secrets.toml on every rerun is wasted work; caching makes the
+    hydration a one-shot per process. Returns the list of keys loaded.
+    """
+    loaded = []
+    try:
+        if hasattr(st, 'secrets') and len(st.secrets) > 0:
+            for key in ['AWS_ACCESS_KEY_ID', 'AWS_SECRET_ACCESS_KEY', 'AWS_SESSION_TOKEN', 'AWS_DEFAULT_REGION']:
+                if key in st.secrets:
+                    value = st.secrets[key]
+                    if isinstance(value, str):
+                        value = value.strip().strip('"').strip("'")
+                    os.environ[key] = value
+                    loaded.append(key)
+    except Exception:
+        pass
+    return loaded
+
+
+_credentials_loaded = _hydrate_env()
 
 # Environment configuration
 AWS_REGION = os.environ.get("AWS_DEFAULT_REGION", os.environ.get("AWS_REGION", "us-east-1"))
@@ -107,10 +88,77 @@ DEFAULT_ACTOR_ID = os.environ.get("DEFAULT_ACTOR_ID", "demo-user")
 # Model configuration - Amazon Nova Pro
 MODEL_ID = os.environ.get("MODEL_ID", "us.amazon.nova-pro-v1:0")
 
+# Bedrock latency-optimized inference (set LATENCY_OPTIMIZED=0 to disable)
+LATENCY_OPTIMIZED = os.environ.get("LATENCY_OPTIMIZED", "1") == "1"
 
-def get_system_prompt() -> str:
-    """Get the system prompt for the Strands Agent."""
-    return """You are an intelligent MSP (Managed Service Provider) Support Assistant with access to a ticket management system and memory capabilities.
+
+# SDK imports are deferred into cached loaders below: importing strands
+# and bedrock_agentcore pulls in a large dependency tree, and paying that
+# cost lazily keeps first paint fast when the user only wants the direct
+# API features.
+
+@st.cache_resource
+def _strands_sdk():
+    """Import the Strands SDK once per process.
+
+    Returns (Agent, BedrockModel), or (None, None) when not installed.
+    """
+    try:
+        from strands import Agent
+        from strands.models import BedrockModel
+        return Agent, BedrockModel
+    except ImportError:
+        return None, None
+
+
+@st.cache_resource
+def _agentcore_sdk():
+    """Import the AgentCore memory integration once per process.
+
+    Returns (AgentCoreMemoryConfig, RetrievalConfig,
+    AgentCoreMemorySessionManager), or (None, None, None) when missing.
+    """
+    try:
+        from bedrock_agentcore.memory.integrations.strands.config import (
+            AgentCoreMemoryConfig,
+            RetrievalConfig
+        )
+        from bedrock_agentcore.memory.integrations.strands.session_manager import (
+            AgentCoreMemorySessionManager
+        )
+        return AgentCoreMemoryConfig, RetrievalConfig, AgentCoreMemorySessionManager
+    except ImportError:
+        return None, None, None
+
+
+@st.cache_resource
+def _ticket_tools() -> list:
+    """Import the @tool decorated ticket tools once per process.
+
+    Touching tool_spec up front forces the docstring/signature reflection
+    that derives each tool's schema, so the first agent invocation does
+    not pay for it mid-conversation.
+    """
+    try:
+        from tools import TICKET_TOOLS
+    except ImportError:
+        return []
+
+    for tool in TICKET_TOOLS:
+        getattr(tool, "tool_spec", None)
+    return TICKET_TOOLS
+
+
+def strands_available() -> bool:
+    return _strands_sdk()[0] is not None
+
+
+def agentcore_available() -> bool:
+    return _agentcore_sdk()[0] is not None
+
+
+# Built once at import; the agent reuses the same string every rebuild
+SYSTEM_PROMPT = """You are an intelligent MSP (Managed Service Provider) Support Assistant with access to a ticket management system and memory capabilities.
 
 ## Available Tools
 
@@ -153,44 +201,119 @@ For summaries, include:
 Personalize your responses based on what you know about the user from memory."""
 
 
-def call_ticket_api(endpoint: str, method: str = "GET", data: Optional[dict] = None) -> dict:
-    """Call the Ticket API directly (fallback when tools unavailable)."""
-    url = f"{API_GATEWAY_ENDPOINT.rstrip('/')}{endpoint}"
+def get_system_prompt() -> str:
+    """Get the system prompt for the Strands Agent."""
+    return SYSTEM_PROMPT
+
+
+@st.cache_resource
+def _etag_store() -> dict:
+    """Process-wide ETag cache: endpoint -> (etag, decoded body)."""
+    return {}
+
+
+class _TicketAPIError(Exception):
+    """Raised inside cached GETs so transport failures are not memoized."""
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def cached_get(endpoint: str) -> dict:
+    """GET a Ticket API endpoint with a 30s TTL and ETag revalidation.
+
+    Within the TTL, repeated sidebar clicks are served from memory. When
+    the TTL lapses we revalidate with If-None-Match, so an unchanged
+    resource costs a 304 with an empty body instead of a full payload.
+    Transport failures are raised rather than returned so st.cache_data
+    never memoizes an error for the full TTL.
+    """
+    store = _etag_store()
     headers = {"Content-Type": "application/json"}
+    cached = store.get(endpoint)
+    if cached:
+        headers["If-None-Match"] = cached[0]
 
     try:
-        if method == "GET":
-            response = requests.get(url, headers=headers, timeout=30)
-        elif method == "POST":
-            response = requests.post(url, headers=headers, json=data, timeout=30)
-        elif method == "PATCH":
-            response = requests.patch(url, headers=headers, json=data, timeout=30)
-        else:
-            return {"error": f"Unsupported method: {method}"}
-
-        return response.json()
+        response = get_http_session().get(
+            f"{_API_BASE}{endpoint}", headers=headers, timeout=30
+        )
+        if response.status_code == 304 and cached:
+            return cached[1]
+
+        body = response.json()
+        etag = response.headers.get("ETag")
+        if etag:
+            store[endpoint] = (etag, body)
+        return body
     except requests.exceptions.RequestException as e:
-        return {"error": str(e)}
+        raise _TicketAPIError(str(e)) from e
+
+
+def call_ticket_api(endpoint: str, method: str = "GET", data: Optional[dict] = None) -> dict:
+    """Call the Ticket API directly (fallback when tools unavailable).
+
+    GETs go through the TTL/ETag cache; writes go through the shared
+    api_client plumbing (pooled connections, retries, circuit breaker).
+    """
+    if method == "GET":
+        try:
+            return cached_get(endpoint)
+        except _TicketAPIError as e:
+            return {"error": str(e)}
+    if method not in ("POST", "PATCH"):
+        return {"error": f"Unsupported method: {method}"}
+
+    result = request_json(method, endpoint, data=data, timeout=(3, 30))
+    if "error" not in result:
+        cached_get.clear()  # Writes invalidate cached listings
+    return result
+
+
+# Session-state defaults applied in one pass on every rerun; session_id
+# is handled separately because its default is computed per session
+_SESSION_DEFAULTS = {
+    "messages": [],
+    "actor_id": DEFAULT_ACTOR_ID,
+    "memory_enabled": True,
+    # Bounded so a long-lived tab cannot grow these without limit
+    "tool_executions": deque(maxlen=50),
+    "strands_agent": None,
+    "session_manager": None,
+    "agent_errors": deque(maxlen=20),
+    "pending_actions": [],
+}
 
 
 def init_session_state():
     """Initialize Streamlit session state."""
-    if "messages" not in st.session_state:
-        st.session_state.messages = []
+    for key in _SESSION_DEFAULTS.keys() - st.session_state.keys():
+        default = _SESSION_DEFAULTS[key]
+        st.session_state[key] = default.copy() if isinstance(default, (list, deque)) else default
     if "session_id" not in st.session_state:
         st.session_state.session_id = f"session-{int(time.time())}"
-    if "actor_id" not in st.session_state:
-        st.session_state.actor_id = DEFAULT_ACTOR_ID
-    if "memory_enabled" not in st.session_state:
-        st.session_state.memory_enabled = True
-    if "tool_executions" not in st.session_state:
-        st.session_state.tool_executions = []
-    if "strands_agent" not in st.session_state:
-        st.session_state.strands_agent = None
-    if "session_manager" not in st.session_state:
-        st.session_state.session_manager = None
-    if "agent_errors" not in st.session_state:
-        st.session_state.agent_errors = []
+
+
+@lru_cache(maxsize=32)
+def _retrieval_config(actor_id: str) -> dict:
+    """Build the per-actor retrieval namespace config, memoized per actor.
+
+    Kept deliberately small: each retrieved record adds prompt tokens and
+    retrieval latency to every turn.
+    """
+    _, RetrievalConfig, _ = _agentcore_sdk()
+    return {
+        f"/preferences/{actor_id}": RetrievalConfig(
+            top_k=3,
+            relevance_score=0.75
+        ),
+        f"/facts/{actor_id}": RetrievalConfig(
+            top_k=4,
+            relevance_score=0.7
+        ),
+        f"/summaries/{actor_id}": RetrievalConfig(
+            top_k=2,
+            relevance_score=0.6
+        )
+    }
 
 
 def create_session_manager(actor_id: str, session_id: str):
@@ -201,7 +324,8 @@ def create_session_manager(actor_id: str, session_id: str):
     - Automatic long-term memory retrieval via hooks
     - Memory extraction via strategies (preferences, facts, summaries)
     """
-    if not AGENTCORE_SDK_AVAILABLE:
+    AgentCoreMemoryConfig, RetrievalConfig, AgentCoreMemorySessionManager = _agentcore_sdk()
+    if AgentCoreMemoryConfig is None:
         return None
 
     try:
@@ -210,21 +334,7 @@ def create_session_manager(actor_id: str, session_id: str):
             memory_id=AGENTCORE_MEMORY_ID,
             session_id=session_id,
             actor_id=actor_id,
-            # Configure retrieval for long-term memory namespaces
-            retrieval_config={
-                f"/preferences/{actor_id}": RetrievalConfig(
-                    top_k=5,
-                    relevance_score=0.7
-                ),
-                f"/facts/{actor_id}": RetrievalConfig(
-                    top_k=10,
-                    relevance_score=0.6
-                ),
-                f"/summaries/{actor_id}": RetrievalConfig(
-                    top_k=3,
-                    relevance_score=0.5
-                )
-            }
+            retrieval_config=_retrieval_config(actor_id)
         )
 
         session_manager = AgentCoreMemorySessionManager(
@@ -235,76 +345,234 @@ def create_session_manager(actor_id: str, session_id: str):
         return session_manager
 
     except Exception as e:
-        st.session_state.agent_errors.append(f"SessionManager: {str(e)}")
+        st.session_state.agent_errors.append(("SessionManager", type(e).__name__, str(e)[:500]))
         return None
 
 
-def create_strands_agent(actor_id: str, session_id: str):
-    """Create a Strands Agent with BedrockModel and AgentCore Memory.
+@st.cache_resource
+def _boto_session():
+    """Shared boto3 Session for all actors.
+
+    Config parsing and credential resolution happen once per process
+    instead of on every agent rebuild. boto3 is imported lazily here
+    (as in the other apps) — its import graph costs hundreds of ms and
+    is not needed until the first agent build.
+    """
+    import boto3
+
+    return boto3.Session(region_name=AWS_REGION)
+
+
+@st.cache_resource
+def _bedrock_client_config():
+    """Botocore config for the Bedrock runtime client behind BedrockModel.
+
+    Keep-alive and a larger pool let concurrent sessions reuse warm
+    connections; adaptive retries back off under throttling instead of
+    hammering the endpoint.
+    """
+    from botocore.config import Config
+
+    return Config(
+        max_pool_connections=50,
+        tcp_keepalive=True,
+        retries={"max_attempts": 3, "mode": "adaptive"},
+    )
+
+
+@st.cache_resource
+def _build_agent(actor_id: str, session_id: str, memory_enabled: bool):
+    """Build the Strands Agent and session manager for one actor/session.
 
     This demonstrates the full Strands + AgentCore integration:
     1. BedrockModel for Amazon Nova Pro
     2. AgentCoreMemorySessionManager for memory
     3. @tool decorated functions for ticket management
+
+    Cached per (actor, session, memory) combination so Streamlit reruns
+    reuse the heavy BedrockModel/boto3 objects instead of rebuilding them
+    on every widget interaction. Returns (agent, session_manager).
+    Construction errors propagate: cache_resource does not memoize
+    raises, so a transient failure is retried on the next rerun instead
+    of being pinned until "Reset Agent".
     """
-    if not STRANDS_AVAILABLE:
-        return None
+    Agent, BedrockModel = _strands_sdk()
+    if Agent is None:
+        return None, None
+
+    # Create Bedrock model with Amazon Nova Pro
+    model_kwargs = {
+        "model_id": MODEL_ID,
+        "boto_session": _boto_session(),
+        "temperature": 0.3,
+        "streaming": True,
+        "boto_client_config": _bedrock_client_config(),
+    }
+    if LATENCY_OPTIMIZED:
+        model_kwargs["additional_request_fields"] = {
+            "performanceConfig": {"latency": "optimized"}
+        }
+    try:
+        # cache_prompt asks Bedrock to cache the static system prompt
+        # across turns so it is not re-processed on every request
+        bedrock_model = BedrockModel(cache_prompt="default", **model_kwargs)
+    except TypeError:
+        try:
+            bedrock_model = BedrockModel(**model_kwargs)
+        except TypeError:
+            # Older strands releases reject the optional kwargs
+            model_kwargs.pop("additional_request_fields", None)
+            model_kwargs.pop("boto_client_config", None)
+            bedrock_model = BedrockModel(**model_kwargs)
+
+    # Create session manager for memory integration
+    session_manager = None
+    if memory_enabled and agentcore_available():
+        session_manager = create_session_manager(actor_id, session_id)
+
+    # Create the Strands Agent
+    agent_kwargs = {
+        "model": bedrock_model,
+        "system_prompt": get_system_prompt(),
+        "tools": _ticket_tools(),
+    }
+
+    # Add session manager if available
+    if session_manager:
+        agent_kwargs["session_manager"] = session_manager
+
+    return Agent(**agent_kwargs), session_manager
+
+
+# Prompts that are plain tool commands gain nothing from memory
+# retrieval, so we skip the embedding lookups for them entirely
+_COMMAND_PROMPT_RE = re.compile(
+    r"^(list|show|get|create|update|overview|summary)\b", re.IGNORECASE
+)
+
+
+def _is_command_prompt(prompt: str) -> bool:
+    """True for short, command-style prompts (e.g. "list open tickets")."""
+    stripped = prompt.strip()
+    return bool(_COMMAND_PROMPT_RE.match(stripped)) or len(stripped.split()) < 5
+
+
+def get_or_create_agent(memory_override: Optional[bool] = None):
+    """Get the cached agent for the current actor/session settings.
+
+    memory_override=False requests the memory-free agent variant for this
+    call without touching the user's sidebar setting; both variants are
+    cached so switching between them is free.
+    """
+    actor_id = st.session_state.get("actor_id", DEFAULT_ACTOR_ID)
+    session_id = st.session_state.get("session_id")
+    memory_enabled = st.session_state.get("memory_enabled", True)
+    use_memory = memory_enabled if memory_override is None else (memory_enabled and memory_override)
 
     try:
-        # Create custom boto3 session (for profile support)
-        boto_session = boto3.Session(region_name=AWS_REGION)
-
-        # Create Bedrock model with Amazon Nova Pro
-        bedrock_model = BedrockModel(
-            model_id=MODEL_ID,
-            boto_session=boto_session,
-            temperature=0.3,
-            streaming=True
+        agent, session_manager = _build_agent(actor_id, session_id, use_memory)
+    except Exception as e:
+        st.session_state.agent_errors.append(
+            ("Agent creation", type(e).__name__, str(e)[:500])
         )
+        agent, session_manager = None, None
 
-        # Create session manager for memory integration
-        session_manager = None
-        if st.session_state.get("memory_enabled", True) and AGENTCORE_SDK_AVAILABLE:
-            session_manager = create_session_manager(actor_id, session_id)
-            st.session_state.session_manager = session_manager
-
-        # Create the Strands Agent
-        agent_kwargs = {
-            "model": bedrock_model,
-            "system_prompt": get_system_prompt(),
-            "tools": TICKET_TOOLS if TOOLS_AVAILABLE else [],
-        }
+    # Thin references kept for the sidebar status captions
+    st.session_state.strands_agent = agent
+    if memory_override is None:
+        st.session_state.session_manager = session_manager
+    st.session_state.current_agent_actor = actor_id
 
-        # Add session manager if available
-        if session_manager:
-            agent_kwargs["session_manager"] = session_manager
+    return agent
 
-        agent = Agent(**agent_kwargs)
 
-        return agent
+def _stream_agent_response(agent, prompt: str, placeholder) -> str:
+    """Consume agent.stream_async(prompt), rendering text as it arrives.
 
-    except Exception as e:
-        st.session_state.agent_errors.append(f"Agent creation: {str(e)}")
-        return None
+    Strands exposes an async event stream; we drive it with a private
+    event loop and repaint the placeholder at most every 50ms so the
+    first tokens show up immediately instead of after the full response.
+    Tool invocations are logged as their events arrive, so the sidebar
+    log fills in without walking the final result object afterwards.
+    """
+    import asyncio
+
+    chunks = []
+    last_render = 0.0
+    tool_entries = {}  # toolUseId -> log entry, updated as input streams in
+
+    async def _consume():
+        nonlocal last_render
+        async for event in agent.stream_async(prompt):
+            if "data" in event:
+                chunks.append(event["data"])
+                now = time.monotonic()
+                if now - last_render >= 0.05:
+                    placeholder.markdown("".join(chunks) + "▌")
+                    last_render = now
+
+            tool_use = event.get("current_tool_use")
+            if tool_use:
+                tool_id = tool_use.get("toolUseId")
+                entry = tool_entries.get(tool_id)
+                if entry is None:
+                    entry = {
+                        "tool": tool_use.get("name", "unknown"),
+                        "input": tool_use.get("input", {}),
+                        "ts": time.time_ns()
+                    }
+                    tool_entries[tool_id] = entry
+                    st.session_state.tool_executions.append(entry)
+                else:
+                    # Input arrives incrementally; keep the entry current
+                    entry["input"] = tool_use.get("input", entry["input"])
 
+    asyncio.run(_consume())
 
-def get_or_create_agent():
-    """Get existing agent or create a new one."""
-    actor_id = st.session_state.get("actor_id", DEFAULT_ACTOR_ID)
-    session_id = st.session_state.get("session_id")
+    text = "".join(chunks)
+    placeholder.markdown(text)
+    return text
+
+
+# Repeated command-style prompts (re-clicked buttons, whitespace-only
+# rephrasings) skip the model entirely for a couple of minutes.
+# Conversational prompts are never cached — their answers depend on
+# history and memory state — and prompts that look like writes flush the
+# cache, since their answers change the underlying ticket data.
+_RESPONSE_CACHE_TTL = 120.0
+_RESPONSE_CACHE_MAX = 64
+_WRITE_PROMPT_RE = re.compile(
+    r"\b(create|update|close|resolve|reopen|delete|add|change|set)\b", re.IGNORECASE
+)
+
+
+@st.cache_resource
+def _response_cache() -> dict:
+    """Process-wide response cache: (actor_id, normalized prompt) -> (ts, text)."""
+    return {}
+
+
+def _normalize_prompt(prompt: str) -> str:
+    return " ".join(prompt.lower().split())
 
-    # Check if we need to recreate agent (actor changed)
-    current_agent = st.session_state.get("strands_agent")
-    current_actor = st.session_state.get("current_agent_actor")
 
-    if current_agent is None or current_actor != actor_id:
-        st.session_state.strands_agent = create_strands_agent(actor_id, session_id)
-        st.session_state.current_agent_actor = actor_id
+def _cached_response(actor_id: str, prompt: str) -> Optional[str]:
+    """Return a fresh cached response for this prompt, if any."""
+    entry = _response_cache().get((actor_id, _normalize_prompt(prompt)))
+    if entry and time.time() - entry[0] < _RESPONSE_CACHE_TTL:
+        return entry[1]
+    return None
 
-    return st.session_state.strands_agent
 
+def _store_response(actor_id: str, prompt: str, response: str) -> None:
+    """Cache a response, evicting the oldest entry when full."""
+    cache = _response_cache()
+    if len(cache) >= _RESPONSE_CACHE_MAX:
+        cache.pop(min(cache, key=lambda k: cache[k][0]))
+    cache[(actor_id, _normalize_prompt(prompt))] = (time.time(), response)
 
-def invoke_strands_agent(prompt: str) -> str:
+
+def invoke_strands_agent(prompt: str, placeholder=None) -> str:
     """Invoke the Strands Agent with a user prompt.
 
     The agent will:
@@ -312,8 +580,29 @@ def invoke_strands_agent(prompt: str) -> str:
     2. Reason about which tools to use
     3. Execute tools and synthesize response
     4. Store conversation in short-term memory
+
+    Command-style prompts bypass memory retrieval to keep tool commands
+    snappy; conversational prompts get the full memory-backed agent.
     """
-    agent = get_or_create_agent()
+    actor_id = st.session_state.get("actor_id", DEFAULT_ACTOR_ID)
+    is_write = bool(_WRITE_PROMPT_RE.search(prompt))
+    # Only command-style prompts are cacheable: they already run on the
+    # memory-bypassed agent, so a hit cannot skip memory storage, and
+    # their answers don't depend on conversation state. Conversational
+    # turns always reach the model.
+    cacheable = not is_write and _is_command_prompt(prompt)
+
+    if cacheable:
+        cached = _cached_response(actor_id, prompt)
+        if cached is not None:
+            if placeholder is not None:
+                placeholder.markdown(cached)
+            return cached
+
+    if _is_command_prompt(prompt):
+        agent = get_or_create_agent(memory_override=False)
+    else:
+        agent = get_or_create_agent()
 
     if agent is None:
         # Fallback message when Strands is not available
@@ -336,6 +625,15 @@ In the meantime, you can use the **Direct API Access** features in the sidebar."
         # - Load conversation history (short-term memory)
         # - Retrieve relevant long-term memories
         # - Store new conversation events after response
+        if is_write:
+            _response_cache().clear()
+
+        if placeholder is not None and hasattr(agent, "stream_async"):
+            response_text = _stream_agent_response(agent, prompt, placeholder)
+            if cacheable:
+                _store_response(actor_id, prompt, response_text)
+            return response_text
+
         response = agent(prompt)
 
         # Track tool executions from the response
@@ -345,22 +643,62 @@ In the meantime, you can use the **Direct API Access** features in the sidebar."
                 st.session_state.tool_executions.append({
                     "tool": tool_result.get("name", "unknown"),
                     "input": tool_result.get("input", {}),
-                    "timestamp": datetime.now().isoformat()
+                    # Raw clock reading; formatting is deferred to the
+                    # sidebar so logging a tool call stays cheap
+                    "ts": time.time_ns()
                 })
 
         # Extract text response
-        if hasattr(response, 'message'):
-            return str(response.message)
-        return str(response)
+        response_text = str(response.message) if hasattr(response, 'message') else str(response)
+        if cacheable:
+            _store_response(actor_id, prompt, response_text)
+        return response_text
 
     except Exception as e:
         error_msg = str(e)
-        st.session_state.agent_errors.append(f"Invoke: {error_msg}")
+        st.session_state.agent_errors.append(("Invoke", type(e).__name__, error_msg[:500]))
         return f"I apologize, but I encountered an error: {error_msg}"
 
 
+@st.fragment
+def _sdk_status_fragment():
+    """Render the static SDK availability badges.
+
+    The probes never change within a process, so this fragment is
+    excluded from reruns triggered by the rest of the sidebar.
+    """
+    st.subheader("SDK Status")
+
+    if strands_available():
+        st.success("Strands SDK: Available")
+    else:
+        st.error("Strands SDK: Not installed")
+        st.caption("pip install strands-agents")
+
+    if agentcore_available():
+        st.success("AgentCore SDK: Available")
+    else:
+        st.warning("AgentCore SDK: Not installed")
+        st.caption("pip install bedrock-agentcore")
+
+    tools = _ticket_tools()
+    if tools:
+        st.success(f"Tools: {len(tools)} loaded")
+    else:
+        st.warning("Tools: Not loaded")
+
+    st.success("Ticket API: Available")
+    st.caption(f"API: {API_GATEWAY_ENDPOINT[:35]}...")
+
+
+@st.fragment
 def render_sidebar():
-    """Render the sidebar with controls and information."""
+    """Render the sidebar with controls and information.
+
+    Runs as a fragment so sidebar widget interactions rerun only this
+    function; actions that must reach the chat area escalate with
+    st.rerun(scope="app").
+    """
     with st.sidebar:
         st.title("🧠 Strands + AgentCore")
         st.markdown("---")
@@ -372,28 +710,7 @@ def render_sidebar():
 
         st.markdown("---")
 
-        # SDK Status
-        st.subheader("SDK Status")
-
-        if STRANDS_AVAILABLE:
-            st.success("Strands SDK: Available")
-        else:
-            st.error("Strands SDK: Not installed")
-            st.caption("pip install strands-agents")
-
-        if AGENTCORE_SDK_AVAILABLE:
-            st.success("AgentCore SDK: Available")
-        else:
-            st.warning("AgentCore SDK: Not installed")
-            st.caption("pip install bedrock-agentcore")
-
-        if TOOLS_AVAILABLE:
-            st.success(f"Tools: {len(TICKET_TOOLS)} loaded")
-        else:
-            st.warning("Tools: Not loaded")
-
-        st.success("Ticket API: Available")
-        st.caption(f"API: {API_GATEWAY_ENDPOINT[:35]}...")
+        _sdk_status_fragment()
 
         st.markdown("---")
 
@@ -433,17 +750,30 @@ def render_sidebar():
         # Tool Executions
         st.subheader("Tool Executions")
         if st.session_state.tool_executions:
-            for i, execution in enumerate(st.session_state.tool_executions[-5:]):
+            for i, execution in enumerate(list(st.session_state.tool_executions)[-5:]):
                 with st.expander(f"🔧 {execution['tool']}", expanded=False):
+                    if "ts" in execution:
+                        st.caption(datetime.fromtimestamp(execution["ts"] / 1e9).strftime("%H:%M:%S"))
                     st.json(execution["input"])
         else:
             st.caption("No tools executed yet")
 
+        # GET-cache counters from the tools module, when it is importable
+        if _ticket_tools():
+            from tools import get_cache_stats
+
+            stats = get_cache_stats()
+            st.caption(
+                f"API cache: {stats['hits']} hits / {stats['misses']} misses"
+            )
+
         # Errors
         if st.session_state.agent_errors:
             with st.expander("⚠️ Agent Errors", expanded=False):
-                for err in st.session_state.agent_errors[-3:]:
-                    st.caption(err)
+                # Entries are (stage, exception class, message) tuples;
+                # the string is built only when actually rendered
+                for kind, cls, msg in list(st.session_state.agent_errors)[-3:]:
+                    st.caption(f"{kind}: {cls}: {msg}")
 
         st.markdown("---")
 
@@ -451,22 +781,25 @@ def render_sidebar():
         st.subheader("Quick Actions")
 
         if st.button("📊 Get Summary", use_container_width=True):
-            st.session_state.pending_action = "Get ticket summary"
+            st.session_state.pending_actions.append("Get ticket summary")
+            st.rerun(scope="app")
 
         if st.button("📋 List Tickets", use_container_width=True):
-            st.session_state.pending_action = "Show all tickets"
+            st.session_state.pending_actions.append("Show all tickets")
+            st.rerun(scope="app")
 
         if st.button("🔄 Clear Chat", use_container_width=True):
             st.session_state.messages = []
-            st.session_state.tool_executions = []
-            st.session_state.agent_errors = []
-            st.rerun()
+            st.session_state.tool_executions = deque(maxlen=50)
+            st.session_state.agent_errors = deque(maxlen=20)
+            st.rerun(scope="app")
 
         if st.button("🔁 Reset Agent", use_container_width=True):
+            _build_agent.clear()  # Drop cached agents so the next run rebuilds
             st.session_state.strands_agent = None
             st.session_state.session_manager = None
             st.session_state.session_id = f"session-{int(time.time())}"
-            st.rerun()
+            st.rerun(scope="app")
 
         st.markdown("---")
 
@@ -541,6 +874,18 @@ def render_sidebar():
             """)
 
 
+@st.fragment
+def _render_history():
+    """Replay the chat transcript.
+
+    Isolated in a fragment so reruns triggered elsewhere do not re-walk
+    the whole message list when it has not changed.
+    """
+    for message in st.session_state.messages:
+        with st.chat_message(message["role"]):
+            st.markdown(message["content"])
+
+
 def render_chat():
     """Render the main chat interface."""
     st.title("🧠 MSP Support Assistant")
@@ -550,9 +895,9 @@ def render_chat():
     )
 
     # SDK status banner
-    if not STRANDS_AVAILABLE:
+    if not strands_available():
         st.warning("Strands SDK not installed. Install with: `pip install strands-agents`")
-    elif not AGENTCORE_SDK_AVAILABLE:
+    elif not agentcore_available():
         st.info("AgentCore SDK not installed. Memory features limited.")
 
     # Example prompts
@@ -560,34 +905,41 @@ def render_chat():
     col1, col2, col3 = st.columns(3)
     with col1:
         if st.button("📊 Overview of tickets", use_container_width=True):
-            st.session_state.pending_action = "Give me an overview of all tickets"
+            st.session_state.pending_actions.append("Give me an overview of all tickets")
     with col2:
         if st.button("🧠 What do you remember?", use_container_width=True):
-            st.session_state.pending_action = "What do you remember about me from our previous conversations?"
+            st.session_state.pending_actions.append("What do you remember about me from our previous conversations?")
     with col3:
         if st.button("🆕 Create ticket", use_container_width=True):
-            st.session_state.pending_action = "I need to report a VPN connection issue that started this morning"
+            st.session_state.pending_actions.append("I need to report a VPN connection issue that started this morning")
 
     st.markdown("---")
 
     # Display chat messages
-    for message in st.session_state.messages:
-        with st.chat_message(message["role"]):
-            st.markdown(message["content"])
-
-    # Handle pending action from buttons
-    if hasattr(st.session_state, "pending_action") and st.session_state.pending_action:
-        prompt = st.session_state.pending_action
-        st.session_state.pending_action = None
+    _render_history()
+
+    # Handle pending actions from buttons. Actions queued in the same
+    # rerun are coalesced into one composite prompt so several clicks
+    # cost a single agent invocation instead of one round trip each.
+    pending = st.session_state.get("pending_actions") or []
+    if pending:
+        st.session_state.pending_actions = []
+        if len(pending) == 1:
+            prompt = pending[0]
+        else:
+            prompt = "Please handle all of the following in one response:\n" + "\n".join(
+                f"{i}. {action}" for i, action in enumerate(pending, 1)
+            )
 
         st.session_state.messages.append({"role": "user", "content": prompt})
         with st.chat_message("user"):
             st.markdown(prompt)
 
         with st.chat_message("assistant"):
-            with st.spinner("Thinking with Strands Agent..."):
-                response = invoke_strands_agent(prompt)
-                st.markdown(response)
+            placeholder = st.empty()
+            placeholder.markdown("▌")
+            response = invoke_strands_agent(prompt, placeholder)
+            placeholder.markdown(response)
 
         st.session_state.messages.append({"role": "assistant", "content": response})
         st.rerun()
@@ -599,15 +951,44 @@ def render_chat():
             st.markdown(prompt)
 
         with st.chat_message("assistant"):
-            with st.spinner("Thinking with Strands Agent..."):
-                response = invoke_strands_agent(prompt)
-                st.markdown(response)
+            placeholder = st.empty()
+            placeholder.markdown("▌")
+            response = invoke_strands_agent(prompt, placeholder)
+            placeholder.markdown(response)
 
         st.session_state.messages.append({"role": "assistant", "content": response})
 
 
+@st.cache_resource
+def _start_warmup():
+    """Kick off background warm-up, once per server process.
+
+    Imports the SDKs and builds the shared boto3 session/client config on
+    a daemon thread while the first page renders. Only process-wide
+    caches are touched; st.session_state is never accessed off the
+    script thread.
+    """
+    import threading
+
+    def _warm():
+        try:
+            _strands_sdk()
+            _agentcore_sdk()
+            _ticket_tools()
+            _boto_session()
+            _bedrock_client_config()
+        except Exception:
+            pass  # Warm-up is best effort; real calls will surface errors
+
+    thread = threading.Thread(target=_warm, daemon=True)
+    thread.start()
+    return thread
+
+
 def main():
     """Main application entry point."""
+    if os.environ.get("WARMUP", "1") == "1":
+        _start_warmup()
     init_session_state()
     render_sidebar()
     render_chat()
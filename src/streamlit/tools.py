@@ -15,11 +15,29 @@ Usage:
     agent = Agent(tools=[list_tickets, create_ticket, get_ticket, update_ticket, get_ticket_summary])
 """
 
+import atexit
+import copy
+import importlib.util
 import os
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional
+from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
 from strands import tool
+from urllib3.util.retry import Retry
+
+# Faster JSON when available; falls back to the stdlib codec so the
+# module stays dependency-light
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # API Gateway endpoint - configurable via environment
 API_GATEWAY_ENDPOINT = os.environ.get(
@@ -27,6 +45,155 @@ API_GATEWAY_ENDPOINT = os.environ.get(
     "https://p3h9ge8d92.execute-api.us-east-1.amazonaws.com"
 )
 
+# Computed once at import so the per-call path does no string trimming
+# or dict building
+_BASE = API_GATEWAY_ENDPOINT.rstrip("/")
+
+# Advertise brotli only when a decoder is importable; urllib3 cannot
+# decompress a br response without one, so an unconditional "br" would
+# break every tool call the moment the server honors it
+_ACCEPT_ENCODING = (
+    "gzip, br"
+    if importlib.util.find_spec("brotli") or importlib.util.find_spec("brotlicffi")
+    else "gzip"
+)
+_DEFAULT_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/json",
+    "Accept-Encoding": _ACCEPT_ENCODING,
+}
+_ALLOWED_METHODS = frozenset({"GET", "POST", "PATCH"})
+
+# One pooled session for every tool call. Agent turns invoke tools in
+# rapid succession against the same host, so keeping the TLS connection
+# alive avoids a handshake per call; retries with backoff are built in.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET", "POST", "PATCH"],
+    ),
+))
+atexit.register(_SESSION.close)
+
+
+def _prewarm_connection() -> None:
+    """Open the TLS connection to API Gateway ahead of the first tool call.
+
+    The DNS lookup plus TLS handshake costs a few hundred milliseconds;
+    doing it on a background thread at import means the first real
+    request reuses an already-warm pooled connection. Failures are
+    ignored — the first tool call just pays the handshake as before.
+    """
+    try:
+        _SESSION.head(f"{_BASE}/health", timeout=5)
+    except requests.RequestException:
+        pass
+
+
+if not os.environ.get("MSP_DISABLE_PREWARM"):
+    threading.Thread(
+        target=_prewarm_connection, name="ticket-api-prewarm", daemon=True
+    ).start()
+
+# TTL + LRU cache for idempotent GETs: within one chat session the same
+# listings are requested over and over, so a short-lived in-process copy
+# skips the whole API Gateway -> Lambda -> DynamoDB round trip. Any
+# successful write flushes it.
+_CACHE_TTL = 30.0
+_CACHE_MAXSIZE = 256
+_cache: OrderedDict = OrderedDict()  # endpoint -> (expires_at, result)
+_cache_lock = threading.RLock()
+_cache_stats = {"hits": 0, "misses": 0}
+
+
+def get_cache_stats() -> dict:
+    """Snapshot of the GET-cache hit/miss counters."""
+    with _cache_lock:
+        return dict(_cache_stats)
+
+
+def _cache_get(endpoint: str) -> Optional[dict]:
+    """Return a fresh cached result for an endpoint, or None."""
+    with _cache_lock:
+        entry = _cache.get(endpoint)
+        if entry and entry[0] > time.monotonic():
+            _cache.move_to_end(endpoint)
+            _cache_stats["hits"] += 1
+            # Deep copy so callers cannot mutate the cached value
+            return copy.deepcopy(entry[1])
+        _cache_stats["misses"] += 1
+        return None
+
+
+def _cache_put(endpoint: str, result: dict) -> None:
+    """Store a GET result, evicting least-recently-used entries."""
+    with _cache_lock:
+        _cache[endpoint] = (time.monotonic() + _CACHE_TTL, copy.deepcopy(result))
+        _cache.move_to_end(endpoint)
+        while len(_cache) > _CACHE_MAXSIZE:
+            _cache.popitem(last=False)
+
+
+# In-flight GET coalescing: concurrent identical GETs (parallel tools,
+# overlapping agent turns) share one HTTP request instead of firing
+# duplicates; the first resolver populates the TTL cache for the rest
+_inflight: dict = {}  # endpoint -> Future
+_inflight_lock = threading.Lock()
+
+
+def _do_request(method: str, endpoint: str, data: Optional[dict]) -> dict:
+    """Perform one HTTP request against the Ticket API."""
+    try:
+        # orjson serializes straight to bytes and decodes response.content
+        # without the stdlib str round trip
+        body = orjson.dumps(data) if (orjson is not None and data is not None) else None
+        response = _SESSION.request(
+            method,
+            f"{_BASE}{endpoint}",
+            headers=_DEFAULT_HEADERS,
+            data=body,
+            json=data if (body is None and method != "GET") else None,
+            timeout=(3.05, 27),
+        )
+        return orjson.loads(response.content) if orjson is not None else response.json()
+    except requests.exceptions.RequestException as e:
+        return {"error": str(e)}
+
+
+def _coalesced_get(endpoint: str) -> dict:
+    """Serve a GET from cache, or join an identical in-flight request."""
+    cached = _cache_get(endpoint)
+    if cached is not None:
+        return cached
+
+    with _inflight_lock:
+        existing = _inflight.get(endpoint)
+        if existing is None:
+            future = Future()
+            _inflight[endpoint] = future
+
+    if existing is not None:
+        # Another thread is already fetching this endpoint; wait for it
+        return copy.deepcopy(existing.result())
+
+    try:
+        result = _do_request("GET", endpoint, None)
+        if "error" not in result:
+            _cache_put(endpoint, result)
+        future.set_result(result)
+        return result
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(endpoint, None)
+
 
 def _call_ticket_api(endpoint: str, method: str = "GET", data: Optional[dict] = None) -> dict:
     """Internal helper to call the Ticket API.
@@ -39,22 +206,31 @@ def _call_ticket_api(endpoint: str, method: str = "GET", data: Optional[dict] =
     Returns:
         API response as dictionary
     """
-    url = f"{API_GATEWAY_ENDPOINT.rstrip('/')}{endpoint}"
-    headers = {"Content-Type": "application/json"}
+    if method not in _ALLOWED_METHODS:
+        return {"error": f"Unsupported method: {method}"}
 
-    try:
-        if method == "GET":
-            response = requests.get(url, headers=headers, timeout=30)
-        elif method == "POST":
-            response = requests.post(url, headers=headers, json=data, timeout=30)
-        elif method == "PATCH":
-            response = requests.patch(url, headers=headers, json=data, timeout=30)
-        else:
-            return {"error": f"Unsupported method: {method}"}
-
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        return {"error": str(e)}
+    if method == "GET":
+        return _coalesced_get(endpoint)
+
+    result = _do_request(method, endpoint, data)
+    if "error" not in result:
+        # Ticket data changed; drop every cached listing
+        with _cache_lock:
+            _cache.clear()
+    return result
+
+
+# Small worker pool for tools that need several independent GETs; the
+# round trips overlap instead of running back to back
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ticket-api")
+
+
+def _parallel_get(endpoints: list) -> list:
+    """Fetch several GET endpoints concurrently over the pooled session.
+
+    Results come back in the order the endpoints were given.
+    """
+    return list(_EXECUTOR.map(_call_ticket_api, endpoints))
 
 
 @tool
@@ -71,15 +247,13 @@ def list_tickets(status: Optional[str] = None, limit: int = 10) -> dict:
     Returns:
         Dictionary containing list of tickets or error message
     """
-    endpoint = "/tickets"
-    params = []
-
+    # urlencode also escapes multi-word statuses like "In Progress"
+    params = {}
     if status:
-        params.append(f"status={status}")
+        params["status"] = status
     if limit:
-        params.append(f"limit={limit}")
-    if params:
-        endpoint += "?" + "&".join(params)
+        params["limit"] = limit
+    endpoint = "/tickets" + (f"?{urlencode(params)}" if params else "")
 
     result = _call_ticket_api(endpoint)
 
@@ -181,14 +355,13 @@ def update_ticket(
     Returns:
         Dictionary containing updated ticket details or error message
     """
-    data = {}
-    if status:
-        data["status"] = status
-    if priority:
-        data["priority"] = priority
-    if note:
-        data["note"] = note
-
+    # is not None (rather than truthiness) keeps empty strings meaningful
+    # if they ever become valid values
+    data = {
+        k: v
+        for k, v in (("status", status), ("priority", priority), ("note", note))
+        if v is not None
+    }
     if not data:
         return {"success": False, "error": "No update fields provided"}
 
@@ -214,6 +387,20 @@ def get_ticket_summary() -> dict:
     Returns:
         Dictionary containing ticket statistics and summary
     """
+    # Counts come pre-aggregated from the server (a few hundred bytes);
+    # the small recent-tickets page is fetched in parallel
+    summary_result, recent_result = _parallel_get(["/tickets/summary", "/tickets?limit=5"])
+
+    if "error" not in summary_result and "summary" in summary_result:
+        recent = [] if "error" in recent_result else recent_result.get("tickets", [])
+        return {
+            "success": True,
+            "summary": summary_result["summary"],
+            "recent_tickets": recent[:5]
+        }
+
+    # Fallback for deployments without /tickets/summary: fetch a page of
+    # tickets and aggregate client-side
     result = _call_ticket_api("/tickets?limit=100")
 
     if "error" in result:
@@ -221,23 +408,14 @@ def get_ticket_summary() -> dict:
 
     tickets = result.get("tickets", [])
 
-    # Compute summary statistics
+    # Compute summary statistics; Counter does the tallying in C
     summary = {
         "total_tickets": len(tickets),
-        "by_status": {},
-        "by_priority": {},
-        "by_category": {}
+        "by_status": dict(Counter(t.get("Status", "Unknown") for t in tickets)),
+        "by_priority": dict(Counter(t.get("Priority", "Unknown") for t in tickets)),
+        "by_category": dict(Counter(t.get("Category", "Unknown") for t in tickets))
     }
 
-    for ticket in tickets:
-        status = ticket.get("Status", "Unknown")
-        priority = ticket.get("Priority", "Unknown")
-        category = ticket.get("Category", "Unknown")
-
-        summary["by_status"][status] = summary["by_status"].get(status, 0) + 1
-        summary["by_priority"][priority] = summary["by_priority"].get(priority, 0) + 1
-        summary["by_category"][category] = summary["by_category"].get(category, 0) + 1
-
     return {
         "success": True,
         "summary": summary,
@@ -267,9 +445,19 @@ def retrieve_memories(query: str, namespace: Optional[str] = None) -> dict:
     Returns:
         Dictionary containing matching memory records
     """
-    # This tool provides agentic RAG capabilities
-    # The actual implementation uses the AgentCore Memory retrieve_memories API
-    # For now, return a placeholder that will be enhanced with actual memory retrieval
+    # Agentic RAG re-queries the same terms within a turn, so results are
+    # memoized on (query, namespace); callers get a copy they can mutate
+    return copy.deepcopy(_retrieve_memories_impl(query, namespace))
+
+
+@lru_cache(maxsize=256)
+def _retrieve_memories_impl(query: str, namespace: Optional[str]) -> dict:
+    """Memory retrieval behind retrieve_memories, memoized per query.
+
+    The actual implementation uses the AgentCore Memory retrieve_memories
+    API; for now this returns a placeholder that will be enhanced with
+    actual memory retrieval.
+    """
     return {
         "success": True,
         "message": "Memory retrieval tool - use session_manager for actual retrieval",
@@ -0,0 +1,29 @@
+"""
+Shared test fixtures.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def no_real_http(monkeypatch):
+    """Stub HTTP at the Session level so no test can hit the network.
+
+    Every requests.* call funnels through Session.request; returning a
+    canned empty-ticket payload keeps an accidental live call against
+    API Gateway from stalling the suite on the client read timeout.
+    Tests that need specific responses still patch at a higher level.
+    """
+    fake_response = MagicMock()
+    fake_response.status_code = 200
+    fake_response.json.return_value = {"tickets": []}
+    fake_response.content = b'{"tickets": []}'
+    fake_response.headers = {}
+
+    monkeypatch.setattr(
+        "requests.sessions.Session.request",
+        MagicMock(return_value=fake_response),
+    )
+    yield fake_response
@@ -2,15 +2,10 @@
 Unit tests for the MSP Support Agent.
 """
 
-import os
-import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "agent"))
-
 
 class TestModelRouter:
     """Tests for the model router."""
@@ -197,9 +192,9 @@ class TestToolSchemas:
             assert "input_schema" in schema
 
     def test_create_ticket_schema_has_required_fields(self):
-        from tools import TOOL_SCHEMAS
+        from tools import TOOL_SCHEMAS_BY_NAME
 
-        create_schema = next(s for s in TOOL_SCHEMAS if s["name"] == "create_ticket")
+        create_schema = TOOL_SCHEMAS_BY_NAME["create_ticket"]
 
         assert "title" in create_schema["input_schema"]["properties"]
         assert "description" in create_schema["input_schema"]["properties"]
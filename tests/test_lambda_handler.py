@@ -3,15 +3,10 @@ Unit tests for the Lambda ticket API handler.
 """
 
 import json
-import os
-import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "lambda"))
-
 
 class TestCreateResponse:
     """Tests for the create_response function."""
@@ -160,6 +155,46 @@ class TestListTickets:
         assert body["count"] == 0
 
 
+class TestGetTicketSummary:
+    """Tests for the server-side ticket summary."""
+
+    @patch("handler.tickets_table")
+    def test_aggregates_counts_by_attribute(self, mock_table):
+        from handler import get_ticket_summary
+
+        mock_table.scan = MagicMock(return_value={
+            "Items": [
+                {"Status": "Open", "Priority": "High", "Category": "Network"},
+                {"Status": "Open", "Priority": "Low", "Category": "Network"},
+                {"Status": "Closed", "Priority": "High", "Category": "Software"},
+            ]
+        })
+
+        response = get_ticket_summary({})
+        body = json.loads(response["body"])
+
+        assert response["statusCode"] == 200
+        assert body["summary"]["total_tickets"] == 3
+        assert body["summary"]["by_status"] == {"Open": 2, "Closed": 1}
+        assert body["summary"]["by_priority"]["High"] == 2
+        assert body["summary"]["by_category"]["Network"] == 2
+
+    @patch("handler.tickets_table")
+    def test_follows_pagination(self, mock_table):
+        from handler import get_ticket_summary
+
+        mock_table.scan = MagicMock(side_effect=[
+            {"Items": [{"Status": "Open"}], "LastEvaluatedKey": {"TicketId": "TKT-1"}},
+            {"Items": [{"Status": "Open"}]},
+        ])
+
+        response = get_ticket_summary({})
+        body = json.loads(response["body"])
+
+        assert body["summary"]["total_tickets"] == 2
+        assert mock_table.scan.call_count == 2
+
+
 class TestLambdaHandler:
     """Tests for the main Lambda handler routing."""
 